@@ -2,6 +2,7 @@ from pyftdi.gpio import GpioSyncController
 import time
 import numpy as np
 from pyftdi.ftdi import Ftdi
+from xy2_frames import frame_bytes
 PIN_MASK = 0x0F  # D0–D4
 
 def moveXY(x,y):
@@ -11,25 +12,7 @@ def moveXY(x,y):
     y = min(y, 1)
     y = max(y, -1)
     y = int(y * 32767) + 32768
-    xbits = format(x, '016b')
-    ybits = format(y, '016b')
-    pin_sequence = []
-    pin_sequence.append((0 << 0) | (0 << 1) | (1 << 2) | (1 << 3))
-    pin_sequence.append((0 << 0) | (0 << 1) | (1 << 2) | (0 << 3))
-    pin_sequence.append((0 << 0) | (0 << 1) | (0 << 2) | (1 << 3))
-    pin_sequence.append((0 << 0) | (0 << 1) | (0 << 2) | (0 << 3))
-    pin_sequence.append((1 << 0) | (1 << 1) | (0 << 2) | (1 << 3))
-    pin_sequence.append((1 << 0) | (1 << 1) | (0 << 2) | (0 << 3))
-    for i in range(16):
-        xb = int(xbits[i])
-        yb = int(ybits[i])
-        pin_sequence.append((yb << 0) | (xb << 1) | (0 << 2) | (1 << 3))
-        pin_sequence.append((yb << 0) | (xb << 1) | (0 << 2) | (0 << 3))
-    pin_sequence.append((0 << 0) | (0 << 1) | (0 << 2) | (1 << 3))
-    pin_sequence.append((0 << 0) | (0 << 1) | (0 << 2) | (0 << 3))
-    
-    # Write the entire sequence
-    return bytes(pin_sequence)
+    return frame_bytes(x, y)
 
 def main():
     ftdi = Ftdi()
@@ -12,18 +12,16 @@ def moveXY(x, y):
     y = min(y, 1)
     y = max(y, -1)
     y = int(y * 131071) + 131072
-    xbits = format(x, '018b')
-    ybits = format(y, '018b')
-    pin_sequence = []
-    pin_sequence.append((1 << 0) | (1 << 1) | (1 << 2) | (1 << 3) | (1 << 4))
-    pin_sequence.append((1 << 0) | (1 << 1) | (1 << 2) | (0 << 3) | (1 << 4))
+    pin_sequence = bytearray(40)
+    pin_sequence[0] = (1 << 0) | (1 << 1) | (1 << 2) | (1 << 3) | (1 << 4)
+    pin_sequence[1] = (1 << 0) | (1 << 1) | (1 << 2) | (0 << 3) | (1 << 4)
     for i in range(18):
-        xb = int(xbits[i])
-        yb = int(ybits[i])
-        pin_sequence.append((yb << 0) | (xb << 1) | (0 << 2) | (1 << 3) | (1 << 4))
-        pin_sequence.append((yb << 0) | (xb << 1) | (0 << 2) | (0 << 3) | (1 << 4))
-    pin_sequence.append((0 << 0) | (0 << 1) | (0 << 2) | (1 << 3) | (0 << 4))
-    pin_sequence.append((0 << 0) | (0 << 1) | (0 << 2) | (0 << 3) | (0 << 4))
+        xb = (x >> (17 - i)) & 1
+        yb = (y >> (17 - i)) & 1
+        pin_sequence[2 + 2*i] = (yb << 0) | (xb << 1) | (0 << 2) | (1 << 3) | (1 << 4)
+        pin_sequence[3 + 2*i] = (yb << 0) | (xb << 1) | (0 << 2) | (0 << 3) | (1 << 4)
+    pin_sequence[38] = (0 << 0) | (0 << 1) | (0 << 2) | (1 << 3) | (0 << 4)
+    pin_sequence[39] = (0 << 0) | (0 << 1) | (0 << 2) | (0 << 3) | (0 << 4)
     
     return bytes(pin_sequence)
 
@@ -1,19 +1,49 @@
 # powermeter_tab.py
 import time
+from collections import deque
 import numpy as np
 import pyvisa
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QMessageBox
-from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QMessageBox
+from PyQt6.QtCore import QTimer, QObject, QThread, pyqtSignal
 from PyQt6.QtCore import Qt
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+import pyqtgraph as pg
 import serial
 
 # match the same constants
 INTERVAL    = 0.05
+REDRAW_MS   = 100
 BUFFER_SIZE = 200
 PM = 92
 Empty = 20
+
+
+class PmWorker(QObject):
+    """
+    Polls the power meter off the GUI thread and emits (t, power) samples.
+    """
+    sampleReady = pyqtSignal(float, float)   # t (s since start), power (uW)
+
+    def __init__(self, pm, start_time):
+        super().__init__()
+        self.pm = pm
+        self.start_time = start_time
+        self._go = False
+
+    def run(self):
+        self._go = True
+        while self._go:
+            try:
+                p = self.pm.read_power()
+            except Exception:
+                p = None
+            if p is not None:
+                self.sampleReady.emit(time.time() - self.start_time, p)
+            QThread.msleep(int(INTERVAL * 1000))
+
+    def stop(self):
+        self._go = False
+
+
 class PowerMeterTab(QWidget):
     def __init__(self, instrument_manager, state):
         super().__init__()
@@ -58,14 +88,15 @@ class PowerMeterTab(QWidget):
         self.close_probe_btn.clicked.connect(self.shutter.closeProbe)
         ctrl.addWidget(self.close_probe_btn)
         
-        # Canvas
-        self.figure = Figure()
-        self.canvas = FigureCanvas(self.figure)
-        self.ax = self.figure.add_subplot(111)
-        self.ax.set_title("PM16-122 Live Power")
-        self.ax.set_xlabel("Time (s)")
-        self.ax.set_ylabel("Power (uW)")
-        main_layout.addWidget(self.canvas)
+        # Plot
+        self.pw = pg.PlotWidget(title="PM16-122 Live Power")
+        self.pw.setLabel('bottom', "Time (s)")
+        self.pw.setLabel('left', "Power (uW)")
+        try:
+            self.pw.useOpenGL(True)     # this widget only; falls back to raster
+        except Exception:
+            pass
+        main_layout.addWidget(self.pw)
 
         # Numeric label
         self.current_lbl = QLabel("-- uW")
@@ -75,61 +106,89 @@ class PowerMeterTab(QWidget):
         font.setBold(True)
         self.current_lbl.setFont(font)
 
-        # data buffers
-        self.times  = np.zeros(BUFFER_SIZE)
-        self.powers = np.zeros(BUFFER_SIZE)
-        self.line, = self.ax.plot(self.times, self.powers, 'o', markersize=4)
-
+        # data buffers (oldest sample drops off automatically)
+        self.tbuf = deque(maxlen=BUFFER_SIZE)
+        self.pbuf = deque(maxlen=BUFFER_SIZE)
+        self.curve = self.pw.plot(pen=None, symbol='o', symbolSize=4,
+                                  antialias=False)
+        # only draw what is visible, at most one point per pixel column
+        self.curve.setDownsampling(auto=True, method='peak')
+        self.curve.setClipToView(True)
+        self.pw.setMouseEnabled(x=False, y=False)
+
+        self.pm_thread = None
+        self.worker = None
+        self.dirty = False
         self.timer = QTimer()
         self.timer.timeout.connect(self._update_plot)
+        # tabs never get closeEvent when the main window closes, so also
+        # stop the acquisition thread when the application quits
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop_measurement)
     
 
 
     def start_measurement(self):
         self.btt.powermeter()
         self.start_time = time.time()
-        self.idx = 0
-        self.times.fill(0)
-        self.powers.fill(0)
-        self.line.set_data(self.times, self.powers)
-        self.ax.set_xlim(0,10); self.ax.set_ylim(0,20000)
+        self.tbuf.clear()
+        self.pbuf.clear()
+        self.curve.setData([], [])
+        self.pw.setXRange(0, 1, padding=0)
+        self.pw.enableAutoRange(axis='y')
 
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
-        self.timer.start(int(INTERVAL * 1000))
+
+        # acquisition runs in its own thread; the GUI only redraws
+        self.pm_thread = QThread()
+        self.worker = PmWorker(self.pm, self.start_time)
+        self.worker.moveToThread(self.pm_thread)
+        self.worker.sampleReady.connect(self._push_sample)
+        self.pm_thread.started.connect(self.worker.run)
+        self.pm_thread.start()
+        self.timer.start(REDRAW_MS)
 
     def stop_measurement(self):
+        if self.worker is None:
+            return                  # not measuring; nothing to stop
         self.timer.stop()
+        self.worker.stop()
+        self.pm_thread.quit()
+        self.pm_thread.wait()
+        self.worker.deleteLater()
+        self.pm_thread.deleteLater()
+        self.worker = None
+        self.pm_thread = None
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.btt.clear()
 
+    def _push_sample(self, t, p_mw):
+        """Runs on the GUI thread for every worker sample; no drawing here."""
+        self.tbuf.append(t)
+        self.pbuf.append(p_mw)
+        self.t_left = self.tbuf[0]
+        self.t_right = t
+        self.last_power = p_mw
+        self.dirty = True
+
     def _update_plot(self):
-        try:
-            p_w = self.pm.read_power()
-        except:
+        if not self.dirty:
             return
-        p_mw = p_w 
-        t = time.time() - self.start_time
-
-        self.times[self.idx % BUFFER_SIZE]  = t
-        self.powers[self.idx % BUFFER_SIZE] = p_mw
-        self.idx += 1
-
-        if self.idx < BUFFER_SIZE:
-            xs, ys = self.times[:self.idx], self.powers[:self.idx]
-            self.line.set_data(xs, ys)
-            self.ax.set_xlim(0, xs.max() + 0.1)
-            ymax = ys.max() * 1.1 if ys.max() > 0 else 20000
-            self.ax.set_ylim(0, ymax)
-        else:
-            window = self.times[(self.idx - BUFFER_SIZE) % BUFFER_SIZE]
-            self.line.set_data(self.times, self.powers)
-            self.ax.set_xlim(window, window + self.times.max() - self.times.min())
-            ymax = self.powers.max() * 1.1 if self.powers.max() > 0 else 20000
-            self.ax.set_ylim(0, ymax)
-
-        self.ax.relim()
-        self.ax.autoscale_view(True, True, True)
+        self.dirty = False
+        p_mw = self.last_power
+
+        n = len(self.tbuf)
+        self.curve.setData(np.fromiter(self.tbuf, dtype=float, count=n),
+                           np.fromiter(self.pbuf, dtype=float, count=n))
+        # x window is known from the buffer ends; only y is autoranged
+        self.pw.setXRange(self.t_left, self.t_right + 0.1, padding=0)
+
         self.current_lbl.setText(f"{p_mw:6.2f} uW")
-        self.canvas.draw()
+
+    def closeEvent(self, event):
+        # make sure the acquisition thread is stopped on window close
+        self.stop_measurement()
+        event.accept()
@@ -1,6 +1,8 @@
 import cv2
 import pygame
 import time
+import queue
+import threading
 import numpy as np
 
 from PyQt6.QtWidgets import (
@@ -16,6 +18,7 @@ DEADZONE  = 0.15
 SCALE_XY  = 2.0
 SCALE_Z   = 0.15
 SCALE_GALVO = 0.001
+FRAME_W, FRAME_H = 640, 480
 
 
 def move_big_motors_from_controller(BTT, galvo, joystick, state):
@@ -121,6 +124,61 @@ class MotorWorker(QObject):
         
 
 
+class BufferlessCapture(threading.Thread):
+    """
+    Reads frames from a cv2.VideoCapture on its own thread and keeps only the
+    newest one, so the GUI never displays frames that queued up in the driver.
+    The capture is owned by the reader thread and released when it exits.
+    """
+    FAIL_SLEEP = 0.05   # s to back off after a failed read
+    MAX_FAILS = 40      # consecutive failed reads (~2 s) before giving up
+
+    def __init__(self, index=0, api=cv2.CAP_DSHOW):
+        super().__init__(daemon=True)
+        self.cap = cv2.VideoCapture(index, api)
+        if not self.cap.isOpened():
+            self.cap.release()
+            raise RuntimeError(f"Could not open camera {index}")
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        self._q = queue.Queue(maxsize=1)
+        self._running = True
+        self.start()
+
+    def run(self):
+        fails = 0
+        try:
+            while self._running:
+                ret, frame = self.cap.read()
+                if not ret:
+                    # unplugged/missing camera fails instantly; don't spin
+                    fails += 1
+                    if fails >= self.MAX_FAILS:
+                        break
+                    time.sleep(self.FAIL_SLEEP)
+                    continue
+                fails = 0
+                try:
+                    self._q.get_nowait()   # drop the stale frame
+                except queue.Empty:
+                    pass
+                self._q.put(frame)
+        finally:
+            # released here, never while read() may still be running
+            self.cap.release()
+
+    def read_latest(self):
+        """Newest frame, or None if nothing new since the last call."""
+        try:
+            return self._q.get_nowait()
+        except queue.Empty:
+            return None
+
+    def release(self):
+        """Stop reading; the thread releases the capture once read() returns."""
+        self._running = False
+        self.join(timeout=1.0)
+
+
 class DraggableVideoLabel(QLabel):
     """
     QLabel subclass that displays the video frame and
@@ -187,7 +245,13 @@ class WebcamTab(QWidget):
         self.cap      = None
         self.timer    = QTimer()
         self.timer.timeout.connect(self._update_frame)
+        self._rebuild_lut(0)
 
+        # persistent display image; frames are written straight into its pixels
+        self._qimg = QImage(FRAME_W, FRAME_H, QImage.Format.Format_BGR888)
+        ptr = self._qimg.bits()
+        ptr.setsize(self._qimg.sizeInBytes())
+        self._qimg_buf = np.frombuffer(ptr, dtype=np.uint8).reshape(FRAME_H, FRAME_W, 3)
 
 
         # — UI —
@@ -210,10 +274,20 @@ class WebcamTab(QWidget):
         self.brightness_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
         self.brightness_slider.valueChanged.connect(self._on_brightness_changed)
 
+        # Software brightness offset applied to the displayed frames
+        self.image_beta_slider = QSlider(Qt.Orientation.Horizontal)
+        self.image_beta_slider.setRange(-100, 100)
+        self.image_beta_slider.setValue(0)
+        self.image_beta_slider.setTickInterval(50)
+        self.image_beta_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
+        self.image_beta_slider.valueChanged.connect(self._rebuild_lut)
+
         ctrl.addWidget(self.start_btn)
         ctrl.addWidget(self.stop_btn)
         ctrl.addWidget(QLabel("LED Brightness"))
         ctrl.addWidget(self.brightness_slider)
+        ctrl.addWidget(QLabel("Image Brightness"))
+        ctrl.addWidget(self.image_beta_slider)
         ctrl.addStretch()
         
         galvo_row = QHBoxLayout()
@@ -316,7 +390,11 @@ class WebcamTab(QWidget):
     def start_all(self):
         # 1) camera
         if self.cap is None:
-            self.cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
+            try:
+                self.cap = BufferlessCapture(0, cv2.CAP_DSHOW)
+            except RuntimeError as e:
+                QMessageBox.warning(self, "Camera Error", str(e))
+                return
         self.timer.start(30)  # ~33 Hz
 
         # 2) motors — make a brand-new thread+worker every time
@@ -355,19 +433,34 @@ class WebcamTab(QWidget):
         except Exception as e:
             QMessageBox.warning(self, "LED Error", f"Couldn’t set brightness:\n{e}")
 
+    def _rebuild_lut(self, beta: int):
+        """Saturating brightness LUT; None when it would be the identity."""
+        if beta == 0:
+            self._lut = None
+        else:
+            self._lut = np.clip(np.arange(256) + beta, 0, 255).astype(np.uint8)
+
     def _update_frame(self):
         if not self.cap:
             return
-        ret, frame = self.cap.read()
-        if not ret:
+        frame = self.cap.read_latest()
+        if frame is None:
             return
-        frame = cv2.convertScaleAbs(frame, alpha=1,
-                                    beta=0)
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = frame.shape
-        bytes_per_line = ch * w
-        qimg = QImage(frame.data, w, h, bytes_per_line,
-                      QImage.Format.Format_RGB888)
+        # Qt6 takes OpenCV's BGR byte order directly, no cvtColor pass
+        if frame.shape[:2] == (FRAME_H, FRAME_W):
+            if self._lut is not None:
+                cv2.LUT(frame, self._lut, dst=self._qimg_buf)
+            else:
+                np.copyto(self._qimg_buf, frame)
+            qimg = self._qimg
+        else:
+            # camera delivered an unexpected size; wrap the frame instead
+            if self._lut is not None:
+                frame = cv2.LUT(frame, self._lut)
+            h, w, ch = frame.shape
+            bytes_per_line = ch * w
+            qimg = QImage(frame.data, w, h, bytes_per_line,
+                          QImage.Format.Format_BGR888)
         self.video_label.setPixmap(QPixmap.fromImage(qimg))
 
     def _on_motor_error(self, msg):
@@ -4,6 +4,7 @@ import tkinter as tk
 from threading import Thread, Event, Lock
 import numpy as np
 import pico_get_val as pico
+from xy2_frames import frame_bytes
 import random
 import time
 
@@ -66,25 +67,7 @@ class ScanApp:
         y = min(y, 1)
         y = max(y, -1)
         y = int(y * 32767) + 32768
-        xbits = format(x, '016b')
-        ybits = format(y, '016b')
-        pin_sequence = []
-        pin_sequence.append((0 << 0) | (0 << 1) | (1 << 2) | (1 << 3))
-        pin_sequence.append((0 << 0) | (0 << 1) | (1 << 2) | (0 << 3))
-        pin_sequence.append((0 << 0) | (0 << 1) | (0 << 2) | (1 << 3))
-        pin_sequence.append((0 << 0) | (0 << 1) | (0 << 2) | (0 << 3))
-        pin_sequence.append((1 << 0) | (1 << 1) | (0 << 2) | (1 << 3))
-        pin_sequence.append((1 << 0) | (1 << 1) | (0 << 2) | (0 << 3))
-        for i in range(16):
-            xb = int(xbits[i])
-            yb = int(ybits[i])
-            pin_sequence.append((yb << 0) | (xb << 1) | (0 << 2) | (1 << 3))
-            pin_sequence.append((yb << 0) | (xb << 1) | (0 << 2) | (0 << 3))
-        pin_sequence.append((0 << 0) | (0 << 1) | (0 << 2) | (1 << 3))
-        pin_sequence.append((0 << 0) | (0 << 1) | (0 << 2) | (0 << 3))
-        
-        # Write the entire sequence
-        return bytes(pin_sequence)
+        return frame_bytes(x, y)
 
     def scan_loop(self):
         """Background scan thread: walks through 50×50 grid, fills data."""
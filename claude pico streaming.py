@@ -6,9 +6,11 @@ from collections import deque
 import threading
 import queue
 
+from pico_ranges import RANGE_MV
+
 try:
     from picosdk.ps5000a import ps5000a as ps
-    from picosdk.functions import adc2mV, assert_pico_ok
+    from picosdk.functions import assert_pico_ok
     import ctypes
     
     # Handle different ways constants are defined across SDK versions
@@ -31,6 +33,12 @@ try:
         PS5000A_2V = 7
         PS5000A_DC = 1
         PS5000A_RATIO_MODE_NONE = 0
+    
+    # Block-ready callback signature: (handle, status, pParameter)
+    try:
+        BlockReadyType = ps.BlockReadyType
+    except AttributeError:
+        BlockReadyType = ctypes.CFUNCTYPE(None, ctypes.c_int16, ctypes.c_uint32, ctypes.c_void_p)
         
 except ImportError:
     print("Warning: PicoScope SDK not installed. Using simulated data.")
@@ -60,6 +68,12 @@ class PicoScopeStreamer:
         # Latency measurement
         self.latency_measurements = []
         
+        # Block-ready signalling: the driver calls back when RunBlock completes,
+        # so the acquisition thread can sleep instead of polling IsReady
+        self._ready_event = threading.Event()
+        self._ready_cb = None  # keep a reference so the callback isn't GC'd
+        self.block_timeout = 1.0  # seconds
+        
         # Initialize PicoScope
         self.init_picoscope()
     
@@ -107,6 +121,15 @@ class PicoScopeStreamer:
                 if status != PICO_OK:
                     raise Exception(f"ps5000aSetChannel failed with status {status}")
             
+            # ADC → mV factor, fixed for the session
+            maxADC = ctypes.c_int16()
+            status = ps.ps5000aMaximumValue(self.chandle, ctypes.byref(maxADC))
+            if status != PICO_OK:
+                raise Exception(f"ps5000aMaximumValue failed with status {status}")
+            self._mv_per_adc = RANGE_MV[self.range_val] / maxADC.value
+            
+            self._ready_cb = BlockReadyType(self._on_block_ready)
+            
             print("PicoScope initialized successfully")
             
         except Exception as e:
@@ -114,6 +137,10 @@ class PicoScopeStreamer:
             print("Falling back to simulated data mode")
             self.chandle = None
     
+    def _on_block_ready(self, handle, status, param):
+        """Called from the driver thread when a block capture completes"""
+        self._ready_event.set()
+    
     def get_sample_block(self):
         """Get a block of samples from PicoScope"""
         if self.chandle is None:
@@ -161,6 +188,7 @@ class PicoScopeStreamer:
                 return None, None
             
             # Run block
+            self._ready_event.clear()
             timeIndisposedMs = ctypes.c_int32()
             status = ps.ps5000aRunBlock(
                 self.chandle,
@@ -169,18 +197,18 @@ class PicoScopeStreamer:
                 timebase,
                 ctypes.byref(timeIndisposedMs),
                 0,  # segmentIndex
-                None,  # lpReady callback
+                self._ready_cb,  # lpReady callback
                 None   # pParameter
             )
             
             if status != PICO_OK:
                 return None, None
             
-            # Wait for data to be ready
-            ready = ctypes.c_int16(0)
-            check = ctypes.c_int16(0)
-            while ready.value == check.value:
-                status = ps.ps5000aIsReady(self.chandle, ctypes.byref(ready))
+            # Wait for data to be ready (sleeps until the lpReady callback fires)
+            if not self._ready_event.wait(timeout=self.block_timeout):
+                ps.ps5000aStop(self.chandle)
+                return None, None
+            self._ready_event.clear()
             
             # Get values
             overflow = ctypes.c_int16()
@@ -198,16 +226,10 @@ class PicoScopeStreamer:
             if status != PICO_OK:
                 return None, None
             
-            # Convert to mV
-            maxADC = ctypes.c_int16()
-            status = ps.ps5000aMaximumValue(self.chandle, ctypes.byref(maxADC))
-            
-            if status == PICO_OK:
-                data = adc2mV(buffer, self.range_val, maxADC)
-                timestamps = np.linspace(0, len(data)/self.sample_rate, len(data)) + time.time()
-                return data, timestamps
-            else:
-                return None, None
+            # Convert to mV in one multiply over a zero-copy view
+            data = np.ctypeslib.as_array(buffer) * self._mv_per_adc
+            timestamps = np.linspace(0, len(data)/self.sample_rate, len(data)) + time.time()
+            return data, timestamps
             
         except Exception as e:
             print(f"Error getting data: {e}")
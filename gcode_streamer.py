@@ -0,0 +1,79 @@
+"""Character-counting G-code streaming shared by the motor scripts."""
+import threading
+from collections import deque
+
+ACK_TIMEOUT = 0.2  # s, safety bound on waiting for 'ok'
+RX_BUDGET = 120    # bytes allowed in flight (firmware RX buffer is 127)
+MAX_STALLS = 10    # ACK_TIMEOUTs with no reply before the count is resynced
+
+
+class GcodeStreamer:
+    """Character-counting G-code streamer.
+
+    Tracks the bytes of every unacknowledged line against the firmware's
+    serial RX buffer and only blocks when the next line would overflow it,
+    so short jog moves pipeline into the planner instead of waiting for a
+    round-trip each.  Both 'ok' and 'error:...' replies acknowledge a line.
+    """
+
+    def __init__(self, ser):
+        self.ser = ser
+        self.pending = deque()  # byte counts of lines awaiting 'ok'
+        self.in_flight = 0
+        self.lock = threading.Lock()
+        self.acked = threading.Event()
+        self.running = True
+        self.reader = threading.Thread(target=self._read_loop, daemon=True)
+        self.reader.start()
+
+    def _read_loop(self):
+        while self.running:
+            try:
+                line = self.ser.readline()  # returns after ser.timeout if idle
+            except Exception:               # port closed or unplugged
+                break
+            if line.startswith(b'error'):
+                print(f"G-code rejected: {line.decode(errors='replace').strip()}")
+            if line.startswith((b'ok', b'error')):
+                with self.lock:
+                    if self.pending:
+                        self.in_flight -= self.pending.popleft()
+                self.acked.set()
+
+    def send(self, line):
+        """Queue one newline-terminated G-code line (bytes)."""
+        n = len(line)
+        stalls = 0
+        while True:
+            with self.lock:
+                if self.in_flight + n <= RX_BUDGET:
+                    self.pending.append(n)
+                    self.in_flight += n
+                    break
+                self.acked.clear()
+            if self.acked.wait(ACK_TIMEOUT):
+                stalls = 0
+                continue
+            stalls += 1
+            if stalls >= MAX_STALLS:
+                # acks were lost (line noise, firmware reset): start counting
+                # afresh rather than blocking the caller forever
+                if not self.reader.is_alive():
+                    raise RuntimeError("G-code reader stopped; port closed?")
+                print("No G-code ack received; resyncing RX budget.")
+                with self.lock:
+                    self.pending.clear()
+                    self.in_flight = 0
+                self.ser.reset_input_buffer()
+                stalls = 0
+        self.ser.write(line)
+
+    def close(self):
+        """Stop the reader; call before closing the port."""
+        self.running = False
+        self.reader.join(timeout=2 * ACK_TIMEOUT + 1)
+
+
+# G-code sender
+def send_gcode(streamer, cmd):
+    streamer.send((cmd + '\n').encode())
@@ -0,0 +1,28 @@
+"""Blocking G-code sender shared by the jack scripts."""
+import time
+
+ACK_TIMEOUT = 5.0  # s, default bound on waiting for one command's 'ok'
+
+_owed = {}  # port -> acks still due from commands that timed out
+
+
+def send_gcode(ser, cmd, timeout=ACK_TIMEOUT):
+    """
+    Send one G-code command and block until the firmware acknowledges it.
+
+    Reads whole reply lines (ser.timeout only bounds each readline) until an
+    'ok' or 'error' reply, first consuming the late acks of earlier commands
+    that timed out so replies never drift out of step with commands.
+    Returns the reply line; raises TimeoutError after `timeout` seconds.
+    """
+    ser.write((cmd + '\n').encode())
+    owed = _owed.pop(ser, 0) + 1
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        line = ser.readline()
+        if line.startswith((b'ok', b'error')):
+            owed -= 1
+            if owed == 0:
+                return line
+    _owed[ser] = owed
+    raise TimeoutError(f"No ack for {cmd!r} within {timeout} s")
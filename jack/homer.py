@@ -1,7 +1,10 @@
 import tkinter as tk
 import serial
+import threading
 import time
 
+from gcode_sync import ACK_TIMEOUT, send_gcode
+
 # Configuration
 PORT_BIG = 'COM9'
 BAUD = 115200
@@ -10,19 +13,15 @@ BAUD = 115200
 HOMING_SEEK_RATE = 5000   # Seek rate for homing (mm/min)
 HOMING_FEEDRATE = 5000    # Feed rate for homing (mm/min)
 TRAVEL_FEED_RATE = 5000   # Feed rate for positional moves (mm/min)
-
-# G-code sender
-def send_gcode(ser, cmd, wait=0.05):
-    """
-    Send a G-code command over serial and wait briefly.
-    """
-    ser.write((cmd + '\n').encode())
-    time.sleep(wait)
+HOMING_TIMEOUT = 120      # s, a G28 only acks once the axis is homed
 
 class MotorControlApp:
     def __init__(self, master, ser):
         self.master = master
         self.ser = ser
+        # serialize G-code sequences so concurrent presses don't interleave
+        self.ser_lock = threading.Lock()
+        self.status = tk.StringVar(value="Ready")
         master.title("Motor Control GUI")
 
         # Create buttons
@@ -36,17 +35,37 @@ class MotorControlApp:
         btn_x20.pack(fill='x', padx=10, pady=5)
         btn_x10.pack(fill='x', padx=10, pady=5)
         btn_x0.pack(fill='x',  padx=10, pady=(5, 10))
+        tk.Label(master, textvariable=self.status).pack(pady=(0, 10))
+
+    def _run_in_background(self, busy, done, *cmds, timeout=ACK_TIMEOUT):
+        """Send cmds on a worker thread so the Tk loop never blocks on acks."""
+        self.status.set(busy)
+
+        def worker():
+            result = done
+            with self.ser_lock:
+                try:
+                    for cmd in cmds:
+                        reply = send_gcode(self.ser, cmd, timeout)
+                        if reply.startswith(b'error'):
+                            result = f"{cmd} failed: {reply.decode(errors='replace').strip()}"
+                            break
+                except (TimeoutError, serial.SerialException) as e:
+                    result = f"Failed: {e}"
+            self.master.after(0, lambda: self.status.set(result))
+
+        threading.Thread(target=worker, daemon=True).start()
 
     def home(self):
         """Home the X axis."""
-        send_gcode(self.ser, 'G28 Y')
-        send_gcode(self.ser, 'G28 X')
-        
+        self._run_in_background("Homing…", "Homed", 'G28 Y', 'G28 X',
+                                timeout=HOMING_TIMEOUT)
 
     def move_to(self, position):
         """Move the X axis to the specified position."""
         # Use G0 for rapid positioning; adjust as needed
-        send_gcode(self.ser, f'G0 Y{position} F{TRAVEL_FEED_RATE}')
+        self._run_in_background(f"Moving to {position}…", f"At {position}",
+                                f'G0 Y{position} F{TRAVEL_FEED_RATE}')
 
 def main():
     try:
@@ -69,11 +69,11 @@ class WebcamTab(QWidget):
         if not ret:
             return
         brightness = self.brightness_slider.value()
-        frame = cv2.convertScaleAbs(frame, alpha=1, beta=brightness)
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        if brightness:
+            cv2.convertScaleAbs(frame, dst=frame, alpha=1, beta=brightness)
         h, w, ch = frame.shape
         bytes_per_line = ch * w
-        qimg = QImage(frame.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
+        qimg = QImage(frame.data, w, h, bytes_per_line, QImage.Format.Format_BGR888)
         self.video_label.setPixmap(QPixmap.fromImage(qimg))
 
     def closeEvent(self, event):
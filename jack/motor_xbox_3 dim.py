@@ -1,16 +1,14 @@
 import pygame
 import serial
 import time
-import numpy as np
+from math import hypot
+
+from gcode_sync import send_gcode
 
 # Configuration
 PORT_big = 'COM3'
 BAUD = 115200
-
-# G-code sender
-def send_gcode(ser, cmd, wait=0.05):
-    ser.write((cmd + '\n').encode())
-    time.sleep(wait)
+READ_TIMEOUT = 0.2  # s, per-readline bound; send_gcode waits for the 'ok'
 
 def move_big_motors_from_controller(ser, joystick, scale=1, deadzone=0.15):
     pygame.event.pump()
@@ -29,7 +27,7 @@ def move_big_motors_from_controller(ser, joystick, scale=1, deadzone=0.15):
 
     # if any XY motion, do that and skip Z
     if dx != 0 or dy != 0:
-        dr = np.hypot(dx, dy)
+        dr = hypot(dx, dy)
         feedrate_xy = dr * 1200
         cmd = f'G1 X{dx} Y{dy} F{feedrate_xy:.1f}'
         send_gcode(ser, cmd)
@@ -73,7 +71,7 @@ def main():
     print(f"Connected: {joystick.get_name()}")
 
     try:
-        with serial.Serial(PORT_big, BAUD, timeout=1) as ser_big:
+        with serial.Serial(PORT_big, BAUD, timeout=READ_TIMEOUT) as ser_big:
             time.sleep(2)
             ser_big.reset_input_buffer()
 
@@ -16,9 +16,17 @@ WIRING  (FT232H 1×8 female header -> Mach-DSP 6-pin “Digital Command Input”
  (Pin 2 “enable” is left un-driven here; tie high or handle elsewhere.)
 
 If you wired D0-D3 in a different order, edit the _BITMASK and the
-byte-assembly code in _build_frame().
+line bits used by the lookup tables in _axis_table()/_fs_clk_template().
+
+Why not MPSSE/SPI: the MPSSE engine clocks out a single data line (ADBUS1),
+but XY2-100 needs X and Y shifted out in parallel on the same clock, so the
+frame has to stay a bit-banged sample stream.  Use move_path() to batch
+frames per USB write instead.  The 245 synchronous FIFO mode is no better
+a fit: it presents bytes on ADBUS only when the FIFO handshake allows
+(RXF#/RD#), so there is no fixed sample rate to carry the galvo CLK.
+
+numpy is only imported for lut='full'; the 'nibble' path is plain Python.
 """
-import time
 from pyftdi.ftdi import Ftdi
 
 # ------------- LOW-LEVEL FTDI INITIALISATION -------------
@@ -28,13 +36,84 @@ _FS_BIT    = 1 << 2             # D2
 _X_BIT     = 1 << 1             # D1
 _Y_BIT     = 1 << 0             # D0
 
+# ------------- FRAME LOOKUP TABLES -------------
+def _axis_table(lane_bit: int) -> 'np.ndarray':
+    """
+    (65536, 40) uint8 table: row v holds the 40 half-cycle samples of one
+    XY2-100 frame with only this axis' data lane set for position v.
+    Clocks 0-18 carry [C2,C1,C0,P15,…,P0] (control = 0b001), clock 19 is 0.
+    """
+    import numpy as np
+    v = np.arange(65536, dtype=np.uint32)
+    bits = np.zeros((65536, 20), dtype=np.uint8)
+    bits[:, 2] = 1                                          # C0
+    bits[:, 3:19] = (v[:, None] >> np.arange(15, -1, -1)) & 1
+    return np.repeat(bits * np.uint8(lane_bit), 2, axis=1)  # both half-cycles
+
+
+def _to_u16(v: float) -> int:
+    """Clip and map one user coord → 16-bit unsigned position."""
+    v = max(-1.0, min(1.0, v))
+    return int(round((v + 1.0) * 32767.5))  # 0…65535
+
+
+def _to_u16_array(v) -> 'np.ndarray':
+    """Vectorised clip-and-map of user coords → 16-bit table indices."""
+    import numpy as np
+    v = np.clip(np.asarray(v, dtype=float), -1.0, 1.0)
+    return np.rint((v + 1.0) * 32767.5).astype(np.intp)  # 0…65535
+
+
+def _fs_clk_template() -> 'np.ndarray':
+    """FS high for clocks 0-18, CLK high on every second half-cycle."""
+    import numpy as np
+    tmpl = np.zeros(40, dtype=np.uint8)
+    tmpl[:38] |= _FS_BIT
+    tmpl[1::2] |= _CLOCK_BIT
+    return tmpl
+
+
+# ------------- NIBBLE TABLES (low-memory alternative) -------------
+_FRAME_TAIL = bytes([0x00, _CLOCK_BIT])   # clock 19: FS low, no data
+
+
+def _lane_word(clocks, lane_bit: int) -> int:
+    """38-byte big-endian word with lane_bit set in both half-cycles of clocks."""
+    w = 0
+    for c in clocks:
+        w |= (lane_bit << (8 * (37 - 2 * c))) | (lane_bit << (8 * (36 - 2 * c)))
+    return w
+
+
+def _nibble_tables(lane_bit: int) -> list:
+    """
+    4 × 16 words: entry [k][n] sets this axis' data lane for position bits
+    P(4k+3)…P(4k) taken from nibble n. Position bit Pi goes out on clock 18-i.
+    """
+    return [[_lane_word([18 - (4 * k + b) for b in range(4) if (n >> b) & 1],
+                        lane_bit)
+             for n in range(16)]
+            for k in range(4)]
+
+
+def _nibble_template() -> int:
+    """C0 on both lanes, FS for clocks 0-18, CLK on every second half-cycle."""
+    w = _lane_word([2], _X_BIT | _Y_BIT) | _lane_word(range(19), _FS_BIT)
+    for c in range(19):
+        w |= _CLOCK_BIT << (8 * (36 - 2 * c))
+    return w
+
+
 class MachDSPDriver:
     def __init__(self,
                  url: str = 'ftdi:///1',
-                 clk_hz: int = 1_000_000):
+                 clk_hz: int = 1_000_000,
+                 lut: str = 'full'):
         """
         url     : PyFtdi URL identifying the FT232H
         clk_hz  : bit-bang sample rate (twice the Mach-DSP clock rate)
+        lut     : 'full'   → per-axis 65536-row tables (~5 MB, fastest)
+                  'nibble' → 4-bit tables (~1 KB), pure-Python int ORs
         """
         self.ft = Ftdi()
         self.ft.open_from_url(url)
@@ -43,51 +122,80 @@ class MachDSPDriver:
         self.ft.write_data(bytearray([0x00]))  # all lines low
         # optional: latency timer tweak (smaller = lower write latency)
         self.ft.set_latency_timer(4)
+        # one reusable frame buffer; _fill_frame writes into it in place
+        self._frame_buf = bytearray(40)
+        if lut == 'nibble':
+            # small per-nibble tables for memory-constrained hosts
+            self._x_tbl = self._y_tbl = None
+            self._x_nib = _nibble_tables(_X_BIT)
+            self._y_nib = _nibble_tables(_Y_BIT)
+            self._nib_tmpl = _nibble_template()
+        else:
+            # per-axis frame tables (~5 MB), built once and OR-ed per frame
+            import numpy as np
+            self._frame_np = np.frombuffer(self._frame_buf, dtype=np.uint8)
+            self._x_tbl = _axis_table(_X_BIT)
+            self._y_tbl = _axis_table(_Y_BIT)
+            self._fs_clk = _fs_clk_template()
+        self._last = (None, None)                   # last (x, y) sent by move()
 
     # ---------- HIGH-LEVEL “MOVE” API ----------
-    def move(self, x: float, y: float) -> None:
+    def move(self, x: float, y: float, force: bool = False) -> None:
         """
         x, y  : user coordinates ∈ [-1.0, +1.0]
                 –1 → full-left/bottom, 0 → centre, +1 → full-right/top
+        force : resend even if (x, y) equals the last point sent
+        """
+        if not force and (x, y) == self._last:
+            return                                  # galvo already there
+        self._last = (x, y)
+        self._fill_frame(x, y)
+        self.ft.write_data(self._frame_buf)
+
+    def move_path(self, xs, ys) -> None:
+        """
+        xs, ys : sequences of user coordinates ∈ [-1.0, +1.0]
+        All frames are concatenated and sent in a single USB write so the
+        FT232H streams them back-to-back.
         """
-        frame = self._build_frame(x, y)
-        self.ft.write_data(frame)
+        if self._x_tbl is None:
+            xv = [_to_u16(x) for x in xs]
+            yv = [_to_u16(y) for y in ys]
+            self.ft.write_data(b''.join(map(self._nibble_frame, xv, yv)))
+        else:
+            xv = _to_u16_array(xs)
+            yv = _to_u16_array(ys)
+            frames = self._x_tbl[xv] | self._y_tbl[yv] | self._fs_clk  # (N, 40)
+            self.ft.write_data(frames.tobytes())
+        if len(xv):
+            self._last = (xs[-1], ys[-1])
 
     # ---------- FRAME GENERATION ----------
-    def _build_frame(self, x: float, y: float) -> bytearray:
+    def _fill_frame(self, x: float, y: float) -> None:
         """
-        Produce 40 samples (20 clocks × 2 half-cycles) for one XY2-100 frame.
-        Control bits = 0b001 → 16-bit position.
+        Write 40 samples (20 clocks × 2 half-cycles) for one XY2-100 frame
+        into self._frame_buf. Control bits = 0b001 → 16-bit position.
         """
         # --- Clip and map user coords → 16-bit unsigned positions ----------
-        def to_u16(v):
-            v = max(-1.0, min(1.0, v))
-            return int(round((v + 1.0) * 32767.5))  # 0…65535
-        x_val, y_val = to_u16(x), to_u16(y)
-
-        # --- Build bit lists: [C2,C1,C0,P15,…,P0] (MSB first) -------------
-        ctrl = (0, 0, 1)
-        x_bits = list(ctrl) + [(x_val >> i) & 1 for i in range(15, -1, -1)]
-        y_bits = list(ctrl) + [(y_val >> i) & 1 for i in range(15, -1, -1)]
-        assert len(x_bits) == len(y_bits) == 19
-
-        buf = bytearray()
-
-        for bit_idx in range(20):                      # 20 clocks
-            # Data for clocks 0-18; clock 19 is a “dummy” with FS low
-            x_bit = x_bits[bit_idx] if bit_idx < 19 else 0
-            y_bit = y_bits[bit_idx] if bit_idx < 19 else 0
-            fs    = 1 if bit_idx < 19 else 0           # FS high until last clock
-
-            # Assemble lines |CLK|FS|X|Y| on D3..D0
-            base = (y_bit << 0) | (x_bit << 1) | (fs << 2)
-
-            # half-cycle 1: CLK = 0, data valid
-            buf.append(base)
-            # half-cycle 2: CLK rises to 1 → Mach-DSP latches on next fall
-            buf.append(base | _CLOCK_BIT)
-
-        return buf
+        x_val, y_val = _to_u16(x), _to_u16(y)
+
+        # --- Lines |CLK|FS|X|Y| on D3..D0 from the precomputed tables ------
+        if self._x_tbl is None:
+            self._frame_buf[:] = self._nibble_frame(x_val, y_val)
+            return
+        self._frame_np[:] = self._x_tbl[x_val]
+        self._frame_np |= self._y_tbl[y_val]
+        self._frame_np |= self._fs_clk
+
+    def _nibble_frame(self, x_val: int, y_val: int) -> bytes:
+        """One 40-byte frame from the 4-bit tables (lut='nibble')."""
+        xt, yt = self._x_nib, self._y_nib
+        w = (self._nib_tmpl
+             | xt[0][x_val & 15] | xt[1][(x_val >> 4) & 15]
+             | xt[2][(x_val >> 8) & 15] | xt[3][x_val >> 12]
+             | yt[0][y_val & 15] | yt[1][(y_val >> 4) & 15]
+             | yt[2][(y_val >> 8) & 15] | yt[3][y_val >> 12])
+        return w.to_bytes(38, 'big') + _FRAME_TAIL
 
     # ---------- HOUSE-KEEPING ----------
     def close(self):
@@ -95,15 +203,18 @@ class MachDSPDriver:
         self.ft.close()
 
 
-# ---------------- EXAMPLE — DRAW A 4-POINT SQUARE ----------------
+# ---------------- EXAMPLE — TRACE A SQUARE ----------------
 if __name__ == '__main__':
+    import numpy as np
     galvo = MachDSPDriver()                 # open FT232H @ 1 MHz
+    EDGE_POINTS = 1000                      # frames per edge (~40 ms @ 1 MHz)
 
     try:
         square = [(-1, -1), (+1, -1), (+1, +1), (-1, +1)]
         while True:                         # repeat forever (Ctrl-C to stop)
-            for x, y in square:
-                galvo.move(x, y)            # jump to corner
-                time.sleep(0.5)             # dwell 0.5 s
+            for (x0, y0), (x1, y1) in zip(square, square[1:] + square[:1]):
+                # one USB write per edge, one frame per interpolated point
+                galvo.move_path(np.linspace(x0, x1, EDGE_POINTS),
+                                np.linspace(y0, y1, EDGE_POINTS))
     finally:
         galvo.close()
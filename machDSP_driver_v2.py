@@ -1,6 +1,6 @@
 # mach_dsp_ft232h_v6.py
 
-import time
+import numpy as np
 from pyftdi.ftdi import Ftdi, BitMode
 
 # D0..D3 mask and line bits
@@ -10,6 +10,26 @@ _FS_BIT     = 1 << 2      # D2 = frame-sync
 _X_BIT      = 1 << 1      # D1 = X data
 _Y_BIT      = 1 << 0      # D0 = Y data
 
+def _axis_table(lane_bit: int) -> np.ndarray:
+    """(65536, 40) frame samples with only this axis' data lane set."""
+    v = np.arange(65536, dtype=np.uint32)
+    bits = np.zeros((65536, 20), dtype=np.uint8)
+    bits[:, 2] = 1  # control bits = 0b001 for 16-bit mode
+    bits[:, 3:19] = (v[:, None] >> np.arange(15, -1, -1)) & 1
+    return np.repeat(bits * np.uint8(lane_bit), 2, axis=1)
+
+def _to_u16_array(v) -> np.ndarray:
+    """Map –1..+1 → 0..65535 for a whole array of coordinates."""
+    v = np.clip(np.asarray(v, dtype=float), -1.0, 1.0)
+    return np.rint((v + 1.0) * 32767.5).astype(np.intp)
+
+def _fs_clk_template() -> np.ndarray:
+    """FS high for clocks 0..18, CLK high on every second half-cycle."""
+    tmpl = np.zeros(40, dtype=np.uint8)
+    tmpl[:38] |= _FS_BIT
+    tmpl[1::2] |= _CLOCK_BIT
+    return tmpl
+
 class MachDSPDriver:
     def __init__(self,
                  url: str = 'ftdi:///1',
@@ -31,36 +51,47 @@ class MachDSPDriver:
         self.ft.set_latency_timer(latency)
         # 5) Idle all lines low
         self.ft.write_data(b'\x00')
+        # 6) Per-axis frame lookup tables (~5 MB), OR-ed together per frame
+        self._x_tbl = _axis_table(_X_BIT)
+        self._y_tbl = _axis_table(_Y_BIT)
+        self._fs_clk = _fs_clk_template()
+        # 7) Reusable frame buffer, filled in place for every move()
+        self._frame_buf = bytearray(40)
+        self._frame_np = np.frombuffer(self._frame_buf, dtype=np.uint8)
+        self._last = (None, None)  # last (x, y) sent by move()
 
-    def move(self, x: float, y: float) -> None:
+    def move(self, x: float, y: float, force: bool = False) -> None:
         """
         Send one 20-clock XY2-100 frame for (x,y) in [–1, +1].
         Add time.sleep(0.001) here if you want to cap at 1000 frames/sec.
+        Repeats of the last point are skipped unless force=True.
+        """
+        if not force and (x, y) == self._last:
+            return  # galvo already there
+        self._last = (x, y)
+        self._fill_frame(x, y)
+        self.ft.write_data(self._frame_buf)
+
+    def move_path(self, xs, ys) -> None:
+        """
+        Send one frame per (x,y) pair as a single USB write, so the frames
+        are clocked out back-to-back instead of one URB per frame.
         """
-        frame = self._build_frame(x, y)
-        self.ft.write_data(frame)
+        xv, yv = _to_u16_array(xs), _to_u16_array(ys)
+        frames = self._x_tbl[xv] | self._y_tbl[yv] | self._fs_clk
+        self.ft.write_data(frames.tobytes())
+        if len(frames):
+            self._last = (xs[-1], ys[-1])
 
-    def _build_frame(self, x: float, y: float) -> bytearray:
+    def _fill_frame(self, x: float, y: float) -> None:
         # Map –1..+1 → 0..65535
         def to_u16(v):
             v = max(-1.0, min(1.0, v))
             return int(round((v + 1.0) * 32767.5))
 
         xv, yv = to_u16(x), to_u16(y)
-        ctrl = (0, 0, 1)  # control bits = 0b001 for 16-bit mode
-
-        x_bits = list(ctrl) + [(xv >> i) & 1 for i in range(15, -1, -1)]
-        y_bits = list(ctrl) + [(yv >> i) & 1 for i in range(15, -1, -1)]
-
-        buf = bytearray()
-        for clk in range(20):
-            xb = x_bits[clk] if clk < 19 else 0
-            yb = y_bits[clk] if clk < 19 else 0
-            fs = 1 if clk < 19 else 0
-            base = (yb << 0) | (xb << 1) | (fs << 2)
-            buf.append(base)              # CLK low
-            buf.append(base | _CLOCK_BIT) # CLK high
-        return buf
+        np.bitwise_or(self._x_tbl[xv], self._y_tbl[yv], out=self._frame_np)
+        self._frame_np |= self._fs_clk
 
     def close(self):
         """Turn off bit-bang and close."""
@@ -68,15 +99,16 @@ class MachDSPDriver:
         self.ft.close()
 
 
-# ─── Example: drive a square at 0.5 s dwell ───
+# ─── Example: trace a square, one write per edge ───
 if __name__ == '__main__':
     galvo = MachDSPDriver(url='ftdi:///1',
                           clk_hz=500_000,
                           latency=4)
+    edge_points = 500  # frames per edge (~40 ms @ 500 kHz)
     try:
         square = [(-1, -1), (1, -1), (1, 1), (-1, 1)]
-        for x, y in square:
-            galvo.move(x, y)
-            time.sleep(0.5)
+        for (x0, y0), (x1, y1) in zip(square, square[1:] + square[:1]):
+            galvo.move_path(np.linspace(x0, x1, edge_points),
+                            np.linspace(y0, y1, edge_points))
     finally:
         galvo.close()
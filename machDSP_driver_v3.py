@@ -1,8 +1,30 @@
 from pyftdi.ftdi import Ftdi
-from pyftdi.gpio import GpioAsyncController
+from pyftdi.gpio import GpioSyncController
+import logging
+import atexit
 import time
 import struct
 import numpy as np
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)   # DEBUG traces every Move
+
+# Five idle clocks before and after each frame, then a final all-low state
+PRE = bytes([0x00, 0x08] * 5)
+POST = PRE + b'\x00'
+
+
+@lru_cache(maxsize=1)
+def _get_gpio():
+    """
+    Open the FT232H once per process and share it between controllers;
+    it is closed at interpreter exit.  D0 = Y-data, D1 = X-data,
+    D2 = Frame Sync, D3 = Clock, all outputs.
+    """
+    gpio = GpioSyncController()
+    gpio.configure('ftdi:///1', direction=0x0F)
+    atexit.register(gpio.close)
+    return gpio
 
 
 class MachDSPController:
@@ -19,40 +41,22 @@ class MachDSPController:
         self.setup_ftdi()
     
     def setup_ftdi(self):
-        """Initialize FTDI device in GPIO mode for bit-banging"""
+        """Attach to the shared FTDI device in synchronous bit-bang mode"""
         try:
-            # Initialize GPIO controller
-            self.gpio = GpioAsyncController()
-            
-            # Open FTDI device (FT232H) - first available device
-            # If you have multiple FTDI devices, you might need to specify the serial number
-            self.gpio.open_from_url('ftdi:///1')
-            
-            # Configure pins D0-D3 as outputs
-            # D0 = Frame Sync (pin 5), D1 = Clock (pin 6), D2 = X-data (pin 4), D3 = Y-data (pin 3)
-            pin_config = 0x0F  # Pins 0-3 as outputs (bits 0-3 = 1)
-            self.gpio.set_direction(pins=pin_config, direction=pin_config)
-            
-            # Initialize all pins low
-            self.gpio.write_port(0x00)
-            time.sleep(0.001)  # Small delay for initialization
+            # The FTDI clocks every byte out at `frequency`, so the galvo
+            # clock is hardware-timed; the USB device is only opened once
+            self.gpio = _get_gpio()
+            self.gpio.set_frequency(self.clock_rate * 2)
+            self.reset()
             
             print("FTDI FT232H initialized successfully")
             
         except Exception as e:
             raise Exception(f"Failed to initialize FTDI device: {e}")
     
-    def write_pins_with_timing(self, pin_states):
-        """
-        Write a sequence of pin states with proper timing
-        
-        Args:
-            pin_states: List of pin state values to write sequentially
-        """
-        for state in pin_states:
-            self.gpio.write_port(state)
-            # Small delay to maintain clock timing - adjust if needed
-            time.sleep(1.0 / (self.clock_rate * 2))  # Half period delay
+    def reset(self):
+        """Drive all pins low without releasing the USB device"""
+        self.gpio.exchange(b'\x00')
     
     def send_bit_sequence(self, frame_sync, x_bits, y_bits):
         """
@@ -64,12 +68,7 @@ class MachDSPController:
             y_bits: List of 19 bits for Y-axis data (MSB first)
         """
         # Pin mapping: D2=Frame Sync, D3=Clock, D1=X-data, D0=Y-data
-        pin_sequence = []
-        for i in range(5):
-            pin_value_low = (0 << 0) | (0 << 1) | (0 << 2) | (0 << 3)
-            pin_sequence.append(pin_value_low)
-            pin_value_high = (0 << 0) | (0 << 1) | (0 << 2) | (1 << 3)
-            pin_sequence.append(pin_value_high)
+        mid = bytearray(40)
         for bit_index in range(20):
             # Determine bit values for this clock cycle
             if bit_index == 0:
@@ -88,21 +87,13 @@ class MachDSPController:
             
             # Clock low phase - set up data (data changes on rising edge)
             pin_value_low = (y_bit << 0) | (x_bit << 1) | (fs_bit << 2) | (0 << 3)
-            pin_sequence.append(pin_value_low)
+            mid[2 * bit_index] = pin_value_low
             
             # Clock high phase - data is latched on falling edge
-            pin_value_high = (y_bit << 0) | (x_bit << 1) | (fs_bit << 2) | (1 << 3)
-            pin_sequence.append(pin_value_high)
-        for i in range(5):
-            pin_value_low = (0 << 0) | (0 << 1) | (0 << 2) | (0 << 3)
-            pin_sequence.append(pin_value_low)
-            pin_value_high = (0 << 0) | (0 << 1) | (0 << 2) | (1 << 3)
-            pin_sequence.append(pin_value_high)
-        # Add final state with frame sync low
-        pin_sequence.append(0x00)
+            mid[2 * bit_index + 1] = pin_value_low | (1 << 3)
         
-        # Write the entire sequence
-        self.write_pins_with_timing(pin_sequence)
+        # Clock the entire sequence out in one synchronous transfer
+        self.gpio.exchange(PRE + bytes(mid) + POST)
     
     def position_to_bits(self, position, use_18bit=False):
         """
@@ -157,7 +148,7 @@ class MachDSPController:
             y_bits = self.position_to_bits(y, use_18bit=False)
             
             # Debug output
-            print(f"Moving to X={x:.3f}, Y={y:.3f}")
+            logger.debug("Moving to X=%.3f, Y=%.3f", x, y)
             
             # Send the command
             self.send_bit_sequence(frame_sync=1, x_bits=x_bits, y_bits=y_bits)
@@ -169,11 +160,10 @@ class MachDSPController:
         """Close FTDI connection"""
         try:
             if self.gpio:
-                # Set all pins low before closing
-                self.gpio.write_port(0x00)
-                self.gpio.close()
+                # Set all pins low; the shared device closes at exit
+                self.reset()
                 self.gpio = None
-                print("FTDI connection closed")
+                print("FTDI connection released")
         except Exception as e:
             print(f"Error closing FTDI: {e}")
 
@@ -1,8 +1,28 @@
 from pyftdi.ftdi import Ftdi
-from pyftdi.gpio import GpioAsyncController
+from pyftdi.gpio import GpioSyncController
+import atexit
 import time
 import struct
 import numpy as np
+from functools import lru_cache
+
+from xy2_frames import lane_tables
+
+# ------------- FRAME LOOKUP TABLES -------------
+X_SEQ, Y_SEQ = lane_tables()
+
+
+@lru_cache(maxsize=1)
+def _get_gpio():
+    """
+    Open the FT232H once per process and share it between controllers;
+    it is closed at interpreter exit.  D0 = Y-data, D1 = X-data,
+    D2 = Frame Sync, D3 = Clock, all outputs.
+    """
+    gpio = GpioSyncController()
+    gpio.configure('ftdi:///1', direction=0x0F)
+    atexit.register(gpio.close)
+    return gpio
 
 
 class MachDSPController:
@@ -19,77 +39,38 @@ class MachDSPController:
         self.setup_ftdi()
     
     def setup_ftdi(self):
-        """Initialize FTDI device in GPIO mode for bit-banging"""
+        """Attach to the shared FTDI device in synchronous bit-bang mode"""
         try:
-            # Initialize GPIO controller
-            self.gpio = GpioAsyncController()
-            
-            # Open FTDI device (FT232H) - first available device
-            # If you have multiple FTDI devices, you might need to specify the serial number
-            self.gpio.open_from_url('ftdi:///1')
-            
-            # Configure pins D0-D3 as outputs
-            # D0 = Frame Sync (pin 5), D1 = Clock (pin 6), D2 = X-data (pin 4), D3 = Y-data (pin 3)
-            pin_config = 0x0F  # Pins 0-3 as outputs (bits 0-3 = 1)
-            self.gpio.set_direction(pins=pin_config, direction=pin_config)
-            
-            # Initialize all pins low
-            self.gpio.write_port(0x00)
-            time.sleep(0.001)  # Small delay for initialization
+            # The FTDI clocks every byte out at `frequency`, so the galvo
+            # clock is hardware-timed; the USB device is only opened once
+            self.gpio = _get_gpio()
+            self.gpio.set_frequency(self.clock_rate * 2)
+            self.reset()
             
             print("FTDI FT232H initialized successfully")
             
         except Exception as e:
             raise Exception(f"Failed to initialize FTDI device: {e}")
     
-    def write_pins_with_timing(self, pin_states):
-        """
-        Write a sequence of pin states with proper timing
-        
-        Args:
-            pin_states: List of pin state values to write sequentially
-        """
-        for state in pin_states:
-            self.gpio.write_port(state)
-            # Small delay to maintain clock timing - adjust if needed
-            time.sleep(1.0 / (self.clock_rate * 2))  # Half period delay
+    def reset(self):
+        """Drive all pins low without releasing the USB device"""
+        self.gpio.exchange(b'\x00')
     
     def moveXY(self,x,y):
-        x = min(x, 1)
-        x = max(x, -1)
-        x = int(x * 32767) + 32768
-        y = min(y, 1)
-        y = max(y, -1)
-        y = int(y * 32767) + 32768
-        xbits = format(x, '016b')
-        ybits = format(y, '016b')
-        pin_sequence = []
-        pin_sequence.append((0 << 0) | (0 << 1) | (1 << 2) | (1 << 3))
-        pin_sequence.append((0 << 0) | (0 << 1) | (1 << 2) | (0 << 3))
-        pin_sequence.append((0 << 0) | (0 << 1) | (0 << 2) | (1 << 3))
-        pin_sequence.append((0 << 0) | (0 << 1) | (0 << 2) | (0 << 3))
-        pin_sequence.append((1 << 0) | (1 << 1) | (0 << 2) | (1 << 3))
-        pin_sequence.append((1 << 0) | (1 << 1) | (0 << 2) | (0 << 3))
-        for i in range(16):
-            xb = int(xbits[i])
-            yb = int(ybits[i])
-            pin_sequence.append((yb << 0) | (xb << 1) | (0 << 2) | (1 << 3))
-            pin_sequence.append((yb << 0) | (xb << 1) | (0 << 2) | (0 << 3))
-        pin_sequence.append((0 << 0) | (0 << 1) | (0 << 2) | (1 << 3))
-        pin_sequence.append((0 << 0) | (0 << 1) | (0 << 2) | (0 << 3))
-        
-        # Write the entire sequence
-        self.write_pins_with_timing(pin_sequence)
+        x = min(max(x, -1), 1)
+        y = min(max(y, -1), 1)
+        xi = int(x * 32767) + 32768
+        yi = int(y * 32767) + 32768
+        self.gpio.exchange((X_SEQ[xi] | Y_SEQ[yi]).tobytes())
     
     def close(self):
         """Close FTDI connection"""
         try:
             if self.gpio:
-                # Set all pins low before closing
-                self.gpio.write_port(0x00)
-                self.gpio.close()
+                # Set all pins low; the shared device closes at exit
+                self.reset()
                 self.gpio = None
-                print("FTDI connection closed")
+                print("FTDI connection released")
         except Exception as e:
             print(f"Error closing FTDI: {e}")
 
@@ -2,52 +2,58 @@ from pyftdi.gpio import GpioSyncController
 import time
 import numpy as np
 
+from realtime import raise_priority
+from xy2_frames import lane_tables
+
 PIN_MASK = 0x0F  # D0–D3
+# In sync bit-bang every byte written clocks one sampled byte into the chip's
+# 1 KiB read FIFO, and the chip stops clocking while that FIFO is full, so
+# large writes must be interleaved with reads: 25 frames per exchange()
+FIFO_BLOCK = 25 * 40
+
+# ------------- FRAME LOOKUP TABLES -------------
+X_SEQ, Y_SEQ = lane_tables()
+_frame = np.empty(40, dtype=np.uint8)   # reused by moveXY
 
 def moveXY(x,y):
-    x = min(x, 1)
-    x = max(x, -1)
-    x = int(x * 32767) + 32768
-    y = min(y, 1)
-    y = max(y, -1)
-    y = int(y * 32767) + 32768
-    xbits = format(x, '016b')
-    ybits = format(y, '016b')
-    pin_sequence = []
-    pin_sequence.append((0 << 0) | (0 << 1) | (1 << 2) | (1 << 3))
-    pin_sequence.append((0 << 0) | (0 << 1) | (1 << 2) | (0 << 3))
-    pin_sequence.append((0 << 0) | (0 << 1) | (0 << 2) | (1 << 3))
-    pin_sequence.append((0 << 0) | (0 << 1) | (0 << 2) | (0 << 3))
-    pin_sequence.append((1 << 0) | (1 << 1) | (0 << 2) | (1 << 3))
-    pin_sequence.append((1 << 0) | (1 << 1) | (0 << 2) | (0 << 3))
-    for i in range(16):
-        xb = int(xbits[i])
-        yb = int(ybits[i])
-        pin_sequence.append((yb << 0) | (xb << 1) | (0 << 2) | (1 << 3))
-        pin_sequence.append((yb << 0) | (xb << 1) | (0 << 2) | (0 << 3))
-    pin_sequence.append((0 << 0) | (0 << 1) | (0 << 2) | (1 << 3))
-    pin_sequence.append((0 << 0) | (0 << 1) | (0 << 2) | (0 << 3))
-    
-    # Write the entire sequence
-    return bytes(pin_sequence)
+    x = min(max(x, -1), 1)
+    y = min(max(y, -1), 1)
+    xi = int(x * 32767) + 32768
+    yi = int(y * 32767) + 32768
+    np.bitwise_or(X_SEQ[xi], Y_SEQ[yi], out=_frame)
+    return _frame.tobytes()
+
+def scan_frames(xs, ys=0.0):
+    """Frames for every (x, y) point as one buffer; same bytes as moveXY."""
+    xi = (np.clip(xs, -1, 1) * 32767).astype(np.int32) + 32768
+    yi = (np.clip(ys, -1, 1) * 32767).astype(np.int32) + 32768
+    # a scalar axis stays a single 40-byte row and broadcasts over the other
+    return (X_SEQ[xi] | Y_SEQ[yi]).tobytes()
 
 def main():
+    raise_priority()
     gpio = GpioSyncController()
     
     # Open in synchronous bit-bang at 1 MHz, low latency
     gpio.configure('ftdi:///1', direction=PIN_MASK,
                        frequency=1000000)
     gpio._ftdi.set_latency_timer(1)
+    gpio._ftdi.write_data_set_chunksize(4096)   # fewer, larger USB writes
+    gpio._ftdi.read_data_set_chunksize(4096)
     try:
-        print("Starting 40-byte transfer loop. Press Ctrl+C to stop.")
+        print("Sending the whole scan. Press Ctrl+C to stop.")
         xvals = np.linspace(-.1,.1,50)
         yvals = np.linspace(-.1,.1,50)
-        for y in yvals:
-            for x in xvals:
-                frame=moveXY(x,y)
-                gpio.exchange(frame)
-        frame=moveXY(0,0)
-        gpio.exchange(frame)        
+        xg, yg = np.meshgrid(xvals, yvals)      # raster order, x fastest
+        scan = scan_frames(xg.ravel(), yg.ravel()) + moveXY(0,0)
+        # The whole scan is built up front; it is clocked out in FIFO-sized
+        # exchanges so each block's echoed samples are drained before the
+        # next is written (a write-only burst would stall on the full FIFO).
+        # No async USB submission ring: pyftdi talks to the FT232H through
+        # pyusb, which has no libusb1 async transfers, and with the frames
+        # prebuilt there is no generation left to overlap with the writes.
+        for i in range(0, len(scan), FIFO_BLOCK):
+            gpio.exchange(scan[i:i + FIFO_BLOCK])
         # clocks out *all* bytes at 1 MHz
     except KeyboardInterrupt:
         pass
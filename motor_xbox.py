@@ -2,80 +2,151 @@ import xbox
 import pygame
 import serial
 import time
-import numpy as np
+import threading
+from functools import lru_cache
+from math import hypot
 
+from gcode_streamer import ACK_TIMEOUT, GcodeStreamer, send_gcode
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 
 # Configuration
 PORT_big = 'COM3'
 BAUD = 115200
 PORT_small = 'COM4'
+SAMPLE_PERIOD = 0.004  # s, controller sampling period (250 Hz)
+DEBOUNCE = 0.2         # s, minimum time between toggles of one servo
+
+
+class ControllerSampler(threading.Thread):
+    """Samples the controller at a fixed rate into a shared snapshot.
+
+    Keeps collecting stick input while the main loop is blocked on the
+    serial link, so a quick flick is not missed.
+    """
+
+    def __init__(self, joystick, period=SAMPLE_PERIOD):
+        super().__init__(daemon=True)
+        self.joystick = joystick
+        self.period = period
+        self.lock = threading.Lock()
+        self.latest = {'x': 0.0, 'y': 0.0, 'a': 0, 'b': 0}
+        self.running = True
+
+    def run(self):
+        js = self.joystick
+        while self.running:
+            pygame.event.pump()
+            sample = {
+                'x': js.get_axis(0),  # Left stick X
+                'y': js.get_axis(1),  # Left stick Y (inverted)
+                'a': js.get_button(0),
+                'b': js.get_button(1),
+            }
+            with self.lock:
+                self.latest.update(sample)
+            time.sleep(self.period)
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.latest)
+
+    def stop(self):
+        self.running = False
+        self.join()
+
+
+@lru_cache(maxsize=4096)
+def jog_command(dx, dy, feedrate):
+    """Encoded G1 line, memoised since a held stick repeats the same move."""
+    return f'G1 X{dx} Y{dy} F{feedrate}\n'.encode()
+
+
+def _jog_math(x_val, y_val, scale, deadzone):
+    """Deadzone + cubic stick scaling; returns (dx, dy, feedrate)."""
+    if abs(x_val) < deadzone: x_val = 0.0
+    if abs(y_val) < deadzone: y_val = 0.0
+
+    # Convert to motion in mm
+    dx = round(x_val**3 * scale, 3)
+    dy = round(y_val**3 * scale, 3)
+    return dx, dy, hypot(dx, dy) * 1200
 
-# G-code sender
-def send_gcode(ser, cmd, wait=0.05):
-    ser.write((cmd + '\n').encode())
-    time.sleep(wait)
-    #while ser.in_waiting:
-        #print('<', ser.readline().decode(errors='ignore').strip())
 
+# Compile the per-sample math once at import when numba is available
+if njit is not None:
+    _compute_jog = njit(cache=True)(_jog_math)
+    _compute_jog(0.0, 0.0, 1.0, 0.15)
+else:
+    _compute_jog = _jog_math
 
 
-def move_big_motors_from_controller(ser, joystick, scale=1, deadzone=0.15):
+def move_big_motors_from_controller(streamer, inputs, scale=1, deadzone=0.15):
     
     """Read controller joystick position and move X/Y motors.
     
     Parameters:
-        ser        : serial.Serial object
-        joystick   : pygame joystick object
+        streamer   : GcodeStreamer wrapping the big-motor serial port
+        inputs     : latest ControllerSampler snapshot
         scale      : multiplier to convert joystick input to mm
         deadzone   : threshold below which input is ignored
         feedrate   : G-code feedrate in mm/min
     """
-    pygame.event.pump()
-    x_val = joystick.get_axis(0)  # Left stick X
-    y_val = joystick.get_axis(1)  # Left stick Y (inverted)
+    x_val = inputs['x']
+    y_val = inputs['y']
 
-    # Apply deadzone
-    if abs(x_val) < deadzone: x_val = 0
-    if abs(y_val) < deadzone: y_val = 0
-
-        
-    # Convert to motion in mm
-    dx = round(x_val**3 * scale, 3)
-    dy = round(y_val**3 * scale, 3)
-    dr = np.sqrt(dx**2 + dy**2)
-    feedrate = dr*1200
+    dx, dy, feedrate = _compute_jog(x_val, y_val, float(scale), float(deadzone))
      
     # Only move if there's meaningful input
     if dx != 0 or dy != 0:
+        # Skip near-duplicates of the last move while it is still unacked
+        last = getattr(move_big_motors_from_controller, "last", None)
+        if (last is not None and streamer.in_flight
+                and abs(dx - last[0]) <= 0.02 * abs(last[0])
+                and abs(dy - last[1]) <= 0.02 * abs(last[1])):
+            return
+        move_big_motors_from_controller.last = (dx, dy)
         #print(f"Joystick X: {x_val:.2f}, Y: {y_val:.2f}  →  Moving X: {dx} mm, Y: {dy} mm")
-        cmd = f'G1 X{dx} Y{dy} F{feedrate}'
-        send_gcode(ser, cmd)
+        # quantise to 10 mm/min for the jog_command cache, never down to F0
+        streamer.send(jog_command(dx, dy, max(10, int(round(feedrate, -1)))))
 
-def move_small_motors(ser, joystick):
+def move_small_motors(ser, inputs):
     new_angle1 = 0
     new_angle2 = 0
-    motor1 = joystick.get_button(0)  # e.g., A button
-    motor2 = joystick.get_button(1)  # e.g., B button
+    motor1 = inputs['a']  # e.g., A button
+    motor2 = inputs['b']  # e.g., B button
     
     
     if not hasattr(move_small_motors, "angle1"):
         move_small_motors.angle1 = 0
         move_small_motors.angle2 = 0
-
-    if motor1:
+        move_small_motors.prev = (0, 0)
+        move_small_motors.last_toggle = [0.0, 0.0]
+
+    # Toggle on the press edge only, at most once per DEBOUNCE, without
+    # stalling the loop that also feeds the big motors
+    now = time.monotonic()
+    prev1, prev2 = move_small_motors.prev
+    move_small_motors.prev = (motor1, motor2)
+    last_toggle = move_small_motors.last_toggle
+
+    if motor1 and not prev1 and now - last_toggle[0] > DEBOUNCE:
+        last_toggle[0] = now
         new_angle1 = 90 if move_small_motors.angle1 == 0 else 0
         ser.write(f"{new_angle1},{new_angle2}\n".encode())
         move_small_motors.angle1 = new_angle1
         print(f"Servo 1 toggled to {new_angle1}")
-        time.sleep(0.2)  # Debounce delay
 
-    if motor2:
+    if motor2 and not prev2 and now - last_toggle[1] > DEBOUNCE:
+        last_toggle[1] = now
         new_angle2 = 90 if move_small_motors.angle2 == 0 else 0
         ser.write(f"{new_angle2},{new_angle2}\n".encode())
         move_small_motors.angle2 = new_angle2
         print(f"Servo 2 toggled to {new_angle2}")
-        time.sleep(0.2)  # Debounce delay
 
     
         
@@ -98,25 +169,33 @@ def main():
     print(f"Connected: {joystick.get_name()}")
 
     # Open both serial connections at once
-    with serial.Serial(PORT_small, BAUD, timeout=1) as ser_small:
+    with serial.Serial(PORT_big, BAUD, timeout=ACK_TIMEOUT) as ser_big, \
+         serial.Serial(PORT_small, BAUD, timeout=1) as ser_small:
 
         time.sleep(2)
         ser_big.reset_input_buffer()
         ser_small.reset_input_buffer()
+        streamer = GcodeStreamer(ser_big)
+        sampler = ControllerSampler(joystick)
+        sampler.start()
 
         # Optional G-code setup for big motors
-        send_gcode(ser_big, 'G21')  # mm units
-        send_gcode(ser_big, 'G91')  # relative positioning
-        send_gcode(ser_big, 'G92 X0 Y0 Z0')  # zero current position
+        send_gcode(streamer, 'G21')  # mm units
+        send_gcode(streamer, 'G91')  # relative positioning
+        send_gcode(streamer, 'G92 X0 Y0 Z0')  # zero current position
 
         try:
             while True:
-                move_big_motors_from_controller(ser_big, joystick)
-                move_small_motors(ser_small, joystick)
+                inputs = sampler.snapshot()
+                move_big_motors_from_controller(streamer, inputs)
+                move_small_motors(ser_small, inputs)
+                time.sleep(SAMPLE_PERIOD)  # no new input before the next sample
                  
         except KeyboardInterrupt:
             print("Stopped by user.")
         finally:
+            sampler.stop()
+            streamer.close()
             pygame.quit()
 
 if __name__ == '__main__':
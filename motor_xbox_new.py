@@ -1,34 +1,34 @@
 import pygame
 import serial
 import time
-import numpy as np
+from math import hypot
+
+from gcode_streamer import ACK_TIMEOUT, GcodeStreamer, send_gcode
+from realtime import raise_priority
 
 # Configuration
 PORT_big = 'COM3'
 PORT_small = 'COM4'
 BAUD = 115200
+DEBOUNCE = 0.2      # s, minimum time between toggles of one servo
+LOOP_PERIOD = 0.005 # s, main-loop yield
 
-# G-code sender
-def send_gcode(ser, cmd, wait=0.05):
-    ser.write((cmd + '\n').encode())
-    time.sleep(wait)
-
-def move_big_motors_from_controller(ser, joystick, scale=1, deadzone=0.15):
-    pygame.event.pump()
+def move_big_motors_from_controller(streamer, joystick, scale=1, deadzone=0.15):
     x_val = joystick.get_axis(0)
     y_val = joystick.get_axis(1)
 
     if abs(x_val) < deadzone: x_val = 0
     if abs(y_val) < deadzone: y_val = 0
+    if not (x_val or y_val):
+        return                      # idle stick: skip the math and formatting
 
     dx = round(x_val**3 * scale, 3)
     dy = round(y_val**3 * scale, 3)
-    dr = np.sqrt(dx**2 + dy**2)
-    feedrate = dr * 1200
+    feedrate = hypot(dx, dy) * 1200
 
     if dx != 0 or dy != 0:
         cmd = f'G1 X{dx} Y{dy} F{feedrate}'
-        send_gcode(ser, cmd)
+        send_gcode(streamer, cmd)
 
 def move_small_motors(ser, joystick):
     motor1 = joystick.get_button(0)
@@ -38,20 +38,28 @@ def move_small_motors(ser, joystick):
         move_small_motors.angle1 = 0
         move_small_motors.angle2 = 0
         move_small_motors.last_sent = ""
+        move_small_motors.prev = (0, 0)
+        move_small_motors.last_toggle = [0.0, 0.0]
 
     updated = False
-
-    if motor1:
+    # Toggle on the press edge only, at most once per DEBOUNCE, without
+    # sleeping in the loop that also drives the big motors
+    now = time.monotonic()
+    prev1, prev2 = move_small_motors.prev
+    move_small_motors.prev = (motor1, motor2)
+    last_toggle = move_small_motors.last_toggle
+
+    if motor1 and not prev1 and now - last_toggle[0] > DEBOUNCE:
+        last_toggle[0] = now
         move_small_motors.angle1 = 90 if move_small_motors.angle1 == 0 else 0
         print(f"Servo 1 toggled to {move_small_motors.angle1}")
         updated = True
-        time.sleep(0.2) 
 
-    if motor2:
+    if motor2 and not prev2 and now - last_toggle[1] > DEBOUNCE:
+        last_toggle[1] = now
         move_small_motors.angle2 = 90 if move_small_motors.angle2 == 0 else 0
         print(f"Servo 2 toggled to {move_small_motors.angle2}")
         updated = True
-        time.sleep(0.2)
         
     
     current_command = f"{move_small_motors.angle1},{move_small_motors.angle2}\n"
@@ -61,6 +69,7 @@ def move_small_motors(ser, joystick):
         move_small_motors.last_sent = current_command
 
 def main():
+    raise_priority()
     pygame.init()
     pygame.joystick.init()
 
@@ -74,21 +83,26 @@ def main():
     print(f"Connected: {joystick.get_name()}")
 
     try:
-        with serial.Serial(PORT_big, BAUD, timeout=1) as ser_big, \
+        with serial.Serial(PORT_big, BAUD, timeout=ACK_TIMEOUT) as ser_big, \
              serial.Serial(PORT_small, BAUD, timeout=1) as ser_small:
 
             time.sleep(2)
             ser_big.reset_input_buffer()
             ser_small.reset_input_buffer()
-
-            send_gcode(ser_big, 'G21')  # mm units
-            send_gcode(ser_big, 'G91')  # relative positioning
-            send_gcode(ser_big, 'G92 X0 Y0 Z0')  # zero current position
-
-            while True:
-                move_big_motors_from_controller(ser_big, joystick)
-                move_small_motors(ser_small, joystick)
-                
+            streamer = GcodeStreamer(ser_big)
+
+            send_gcode(streamer, 'G21')  # mm units
+            send_gcode(streamer, 'G91')  # relative positioning
+            send_gcode(streamer, 'G92 X0 Y0 Z0')  # zero current position
+
+            try:
+                while True:
+                    pygame.event.pump()  # once per pass; both readers share it
+                    move_big_motors_from_controller(streamer, joystick)
+                    move_small_motors(ser_small, joystick)
+                    time.sleep(LOOP_PERIOD)
+            finally:
+                streamer.close()
     except KeyboardInterrupt:
         print("Stopped by user.")
     finally:
@@ -9,6 +9,8 @@ from picosdk.ps5000a import ps5000a as ps     # correct wrapper for 5444D
 
 # sanity-check (optional)
 import ctypes
+import numpy as np
+from pico_ranges import RANGE_MV
 ctypes.WinDLL("ps5000a")          # will raise if the DLL still isn’t visible
 
 res = ps.PS5000A_DEVICE_RESOLUTION['PS5000A_DR_8BIT']
@@ -17,6 +19,7 @@ res = ps.PS5000A_DEVICE_RESOLUTION['PS5000A_DR_8BIT']
 CHANNEL = ps.PS5000A_CHANNEL['PS5000A_CHANNEL_A']
 COUPLING = ps.PS5000A_COUPLING['PS5000A_DC']
 RANGE = ps.PS5000A_RANGE['PS5000A_2V']  # ±2V
+FULL_SCALE_MV = RANGE_MV[RANGE]         # full scale of RANGE in mV
 SAMPLES = 1000
 TIMEBASE = 8  # Adjust as needed
 OVERSAMPLE = 1
@@ -58,7 +61,8 @@ status = ps.ps5000aGetValues(handle, 0, ctypes.byref(ctypes.c_uint32(SAMPLES)),
 assert status == 0, "Failed to get values"
 
 # Step 8: Convert ADC to mV
-voltage = np.array([adc2mV(val, RANGE, 32767) / 1000 for val in buffer])  # in Volts
+raw = np.ctypeslib.as_array(buffer)          # zero-copy view of the int16 codes
+voltage = raw.astype(np.float32) * (FULL_SCALE_MV / 32767 / 1000)  # in Volts
 
 # Step 9: Stop and close
 ps.ps5000aStop(handle)
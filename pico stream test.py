@@ -3,13 +3,13 @@ import ctypes
 import numpy as np
 import time
 import threading
-from collections import deque
 
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 
 from picosdk.ps5000a import ps5000a as ps
-from picosdk.functions import adc2mV, assert_pico_ok
+from picosdk.functions import assert_pico_ok
+from pico_ranges import RANGE_MV
 
 # ─── DEVICE SETUP ──────────────────────────────────────────────────────────────
 chandle = ctypes.c_int16()
@@ -54,11 +54,14 @@ WINDOW     = 1000   # rolling window size (1 s at 1 kHz)
 interval_us = ctypes.c_int32(1000)
 units       = ps.PS5000A_TIME_UNITS["PS5000A_US"]
 
+# driver’s raw buffer; the callback reads this same array
+bufferA = (ctypes.c_int16 * CHUNK)()
+
 # no pre-trigger, post-trigger = CHUNK, auto-stop off
 status["setBuf"] = ps.ps5000aSetDataBuffers(
     chandle,
     ps.PS5000A_CHANNEL["PS5000A_CHANNEL_A"],
-    (ctypes.c_int16 * CHUNK)(),  # driver’s raw buffer
+    bufferA,
     None,
     CHUNK,
     0,  # memory segment
@@ -81,17 +84,22 @@ assert_pico_ok(status["run"])
 print("Streaming @ 1 kHz...")
 
 # ─── ROLLING BUFFER ────────────────────────────────────────────────────────────
-data_q = deque([0.0]*WINDOW, maxlen=WINDOW)
+# ring of the last WINDOW samples; ring[head] is the oldest
+ring = np.zeros(WINDOW, dtype=np.float32)
+head = 0
 
 # ─── STREAMING CALLBACK ───────────────────────────────────────────────────────
-# bufferA must match what we passed to SetDataBuffers
-bufferA = (ctypes.c_int16 * CHUNK)()
+raw_view = np.ctypeslib.as_array(bufferA)      # zero-copy view of bufferA
+mv_per_adc = RANGE_MV[vrange] / maxADC.value
 
 def streaming_callback(handle, noOfSamples, startIndex, overflow, triggerAt, triggered, autoStop, param):
-    raw = bufferA[startIndex : startIndex + noOfSamples]
-    mv  = adc2mV(raw, vrange, maxADC)
-    for v in mv:
-        data_q.append(v)
+    global head
+    mv = raw_view[startIndex : startIndex + noOfSamples] * mv_per_adc
+    # at most two slice copies, splitting at the wrap
+    first = min(noOfSamples, WINDOW - head)
+    ring[head:head + first] = mv[:first]
+    ring[:noOfSamples - first] = mv[first:]
+    head = (head + noOfSamples) % WINDOW
 
 cptr = ps.StreamingReadyType(streaming_callback)
 
@@ -111,14 +119,19 @@ thread.start()
 # ─── LIVE PLOT ─────────────────────────────────────────────────────────────────
 fig, ax = plt.subplots()
 x = np.linspace(-WINDOW/1000, 0, WINDOW)
-line, = ax.plot(x, list(data_q))
+line, = ax.plot(x, ring)
 ax.set_xlabel("Time (s)")
 ax.set_ylabel("Channel A (mV)")
 ax.set_ylim(-vrange*100*1.1, vrange*100*1.1)
 ax.set_title("Last 1000 samples @ 1 kHz")
 
+# oldest-first copy of the ring, reused every frame
+display = np.empty_like(ring)
+
 def update(_):
-    line.set_ydata(list(data_q))
+    h = head
+    np.concatenate((ring[h:], ring[:h]), out=display)
+    line.set_ydata(display)
     return line,
 
 # redraw ~60 times/sec for smooth UI
@@ -9,7 +9,8 @@ import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 
 from picosdk.ps5000a import ps5000a as ps
-from picosdk.functions import adc2mV, assert_pico_ok
+from picosdk.functions import assert_pico_ok
+from pico_ranges import RANGE_MV
 
 # ─── DEVICE SETUP ──────────────────────────────────────────────────────────────
 chandle = ctypes.c_int16()
@@ -52,10 +53,13 @@ WINDOW   = 1000    # rolling window size (1 s at 1 kHz)
 interval_us = ctypes.c_int32(1000)
 units       = ps.PS5000A_TIME_UNITS["PS5000A_US"]
 
+# driver’s raw buffer; the callback reads this same array
+bufferA = (ctypes.c_int16 * CHUNK)()
+
 status["setBuf"] = ps.ps5000aSetDataBuffers(
     chandle,
     ps.PS5000A_CHANNEL["PS5000A_CHANNEL_A"],
-    (ctypes.c_int16 * CHUNK)(),
+    bufferA,
     None,
     CHUNK,
     0,
@@ -81,13 +85,11 @@ print("Streaming @ 1 kHz...")
 data_q = deque([0.0]*WINDOW, maxlen=WINDOW)
 
 # ─── STREAMING CALLBACK ───────────────────────────────────────────────────────
-bufferA = (ctypes.c_int16 * CHUNK)()
+raw_view = np.ctypeslib.as_array(bufferA)      # zero-copy view of bufferA
+mv_per_adc = RANGE_MV[vrange] / maxADC.value
 
 def streaming_callback(handle, noOfSamples, startIndex, overflow, triggerAt, triggered, autoStop, param):
-    raw = bufferA[startIndex : startIndex + noOfSamples]
-    mv  = adc2mV(raw, vrange, maxADC)
-    for v in mv:
-        data_q.append(v)
+    data_q.extend(raw_view[startIndex : startIndex + noOfSamples] * mv_per_adc)
 
 cptr = ps.StreamingReadyType(streaming_callback)
 
@@ -54,25 +54,29 @@ assert_pico_ok(ps.ps5000aSetDataBuffers(
     0,
     ratio_mode
 ))
+# D0–D7 live in the low byte of each int16 (little-endian)
+buffer_d_lo = buffer_d.view(np.uint8)[::2]
 
-# --- Storage for samples ---
-adc_values     = []
-digital_values = []
+# --- Storage for samples (preallocated; one slice copy per block) ---
+adc_values     = np.empty(max_samples + overview_size, dtype=np.int16)
+digital_values = np.empty(max_samples + overview_size, dtype=np.uint8)
+write_idx = 0
 done = False
 
 # --- Callback to grab each block of both analog and digital samples ---
 def streaming_callback(handle, n_samples, start_index,
                        overflow, trigger_at, triggered,
                        auto_stop_flag, user_data):
-    global done
+    global done, write_idx
     if overflow:
         print("⚠️ Overflow!")
+    n   = min(n_samples, len(adc_values) - write_idx)
+    end = write_idx + n
     # copy analog
-    block_a = buffer_a[start_index:start_index + n_samples]
-    adc_values.extend(block_a.tolist())
+    adc_values[write_idx:end] = buffer_a[start_index:start_index + n]
     # copy digital (each value is a bitmask for D0–D7) :contentReference[oaicite:1]{index=1}
-    block_d = buffer_d[start_index:start_index + n_samples]
-    digital_values.extend(block_d.tolist())
+    digital_values[write_idx:end] = buffer_d_lo[start_index:start_index + n]
+    write_idx = end
     if auto_stop_flag:
         done = True
 
@@ -101,6 +105,9 @@ while time.time() - start_time < 3:
 ps.ps5000aStop(chandle)
 ps.ps5000aCloseUnit(chandle)
 
+adc_values     = adc_values[:write_idx]
+digital_values = digital_values[:write_idx]
 print(f"Analog samples: {len(adc_values)}")
 print(f"Digital samples: {len(digital_values)}")
 print(digital_values[0:100])
+print(f"D0 high in {np.count_nonzero(digital_values & 1)} samples")
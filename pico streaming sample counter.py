@@ -1,4 +1,6 @@
 import ctypes
+import os
+import sys
 import time
 import numpy as np
 
@@ -48,17 +50,28 @@ status = ps.ps5000aSetDataBuffers(
 )
 assert_pico_ok(status)
 
-# --- Storage for all samples ---
-adc_values = []
+# --- Storage for all samples (preallocated for the whole capture) ---
+# Disk-backed so long runs don't have to fit in RAM; the raw int16 file can
+# be reopened with np.memmap for analysis after the run.  The file is sized
+# for the whole run up front and trimmed to the samples received at the end;
+# pass a path to write it somewhere other than data/capture.i16
+capture_s    = 15.01
+capture_file = (sys.argv[1] if len(sys.argv) > 1 else
+                os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'capture.i16'))
+os.makedirs(os.path.dirname(os.path.abspath(capture_file)), exist_ok=True)
+max_samples  = int(capture_s * 1e6 / sample_interval.value) + overview_size
+adc_values   = np.memmap(capture_file, mode='w+', dtype=np.int16, shape=(max_samples,))
+write_idx   = 0
 
-# --- Callback to copy each block into our list ---
+# --- Callback to copy each block into our array ---
 def streaming_callback(handle, n_samples, start_index, overflow, trigger_at, triggered, auto_stop_flag, user_data):
-    global adc_values
+    global write_idx
     if overflow:
         print("⚠️ Overflow!")
 
-    block = buffer_a[start_index:start_index + n_samples]
-    adc_values.extend(block.tolist())
+    n = min(n_samples, max_samples - write_idx)
+    adc_values[write_idx:write_idx + n] = buffer_a[start_index:start_index + n]
+    write_idx += n
 
 # Convert to C-callable pointer
 c_callback = ps.StreamingReadyType(streaming_callback)
@@ -79,7 +92,7 @@ assert_pico_ok(status)
 
 # --- Poll for 5 seconds ---
 start_time = time.time()
-while time.time() - start_time < 15.01:
+while time.time() - start_time < capture_s:
     ps.ps5000aGetStreamingLatestValues(chandle, c_callback, None)
     time.sleep(0.005)
 
@@ -87,4 +100,7 @@ while time.time() - start_time < 15.01:
 ps.ps5000aStop(chandle)
 ps.ps5000aCloseUnit(chandle)
 
-print(f"Collected {len(adc_values)} samples")
+adc_values.flush()
+del adc_values                                       # unmap before truncating
+os.truncate(capture_file, write_idx * np.dtype(np.int16).itemsize)
+print(f"Collected {write_idx} samples → {capture_file}")
@@ -9,7 +9,8 @@ import ctypes
 from picosdk.ps5000a import ps5000a as ps
 import numpy as np
 import matplotlib.pyplot as plt
-from picosdk.functions import adc2mV, assert_pico_ok, mV2adc
+from picosdk.functions import assert_pico_ok, mV2adc
+from pico_ranges import RANGE_MV
 
 # Create chandle and status ready for use
 status = {}
@@ -309,16 +310,19 @@ for i in Ten_TriggerInfo:
     print("timeStampCounter is ", i.timeStampCounter)
 
 # Converts ADC from channel A to mV
-adc2mVChAMax =  adc2mV(bufferAMax, chARange, maxADC)
-adc2mVChAMax1 =  adc2mV(bufferAMax1, chARange, maxADC)
-adc2mVChAMax2 =  adc2mV(bufferAMax2, chARange, maxADC)
-adc2mVChAMax3 =  adc2mV(bufferAMax3, chARange, maxADC)
-adc2mVChAMax4 =  adc2mV(bufferAMax4, chARange, maxADC)
-adc2mVChAMax5 =  adc2mV(bufferAMax5, chARange, maxADC)
-adc2mVChAMax6 =  adc2mV(bufferAMax6, chARange, maxADC)
-adc2mVChAMax7 =  adc2mV(bufferAMax7, chARange, maxADC)
-adc2mVChAMax8 =  adc2mV(bufferAMax8, chARange, maxADC)
-adc2mVChAMax9 =  adc2mV(bufferAMax9, chARange, maxADC)
+# The scale depends only on the range and maxADC, so compute it once and
+# multiply zero-copy views of the buffers instead of calling adc2mV per buffer
+mvPerAdc = RANGE_MV[chARange] / maxADC.value
+adc2mVChAMax = np.ctypeslib.as_array(bufferAMax) * mvPerAdc
+adc2mVChAMax1 = np.ctypeslib.as_array(bufferAMax1) * mvPerAdc
+adc2mVChAMax2 = np.ctypeslib.as_array(bufferAMax2) * mvPerAdc
+adc2mVChAMax3 = np.ctypeslib.as_array(bufferAMax3) * mvPerAdc
+adc2mVChAMax4 = np.ctypeslib.as_array(bufferAMax4) * mvPerAdc
+adc2mVChAMax5 = np.ctypeslib.as_array(bufferAMax5) * mvPerAdc
+adc2mVChAMax6 = np.ctypeslib.as_array(bufferAMax6) * mvPerAdc
+adc2mVChAMax7 = np.ctypeslib.as_array(bufferAMax7) * mvPerAdc
+adc2mVChAMax8 = np.ctypeslib.as_array(bufferAMax8) * mvPerAdc
+adc2mVChAMax9 = np.ctypeslib.as_array(bufferAMax9) * mvPerAdc
 
 # Creates the time data
 time = np.linspace(0, (cmaxSamples.value - 1) * timeIntervalns.value, cmaxSamples.value)
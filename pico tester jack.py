@@ -4,6 +4,7 @@ os.environ["PATH"] = PICO_DLL_DIR + os.pathsep + os.environ["PATH"]  # find ps50
 # ─── END boilerplate ──────────────────────────────
 
 import ctypes
+import threading
 import numpy as np
 import matplotlib.pyplot as plt
 from picosdk.ps5000a import ps5000a as ps
@@ -33,59 +34,88 @@ assert status == 0, f"SetChannel failed (status {status})."
 # -------------- timebase & buffer ----------------
 TIME_INTERVAL_NS = 1_000    # 1 µs → 1 MS/s
 N_SAMPLES        = 10_000   # 10 k points → 10 ms span
+N_CAPTURES       = 2        # back-to-back blocks; the last one is plotted
+                            # (>= 2 so a segment is armed while one is read)
 
 timebase   = 8              # empirically: 1 µs @ 1 MS/s on 5444D
-oversample = 0
 time_int   = ctypes.c_float()
 max_samples= ctypes.c_int32()
 
+# Two memory segments so the next block can be acquiring into one while the
+# previous one is fetched and converted from the other
+status = ps.ps5000aMemorySegments(handle, 2, ctypes.byref(max_samples))
+assert status == 0, f"MemorySegments failed (status {status})."
+
 status = ps.ps5000aGetTimebase2(
-    handle, timebase, N_SAMPLES, ctypes.byref(time_int), oversample,
+    handle, timebase, N_SAMPLES, ctypes.byref(time_int),
     ctypes.byref(max_samples), 0
 )
 assert status == 0, f"Timebase not supported (status {status})."
 
-# Allocate numpy buffer backed by ctypes array
-bufftype = ctypes.c_int16 * N_SAMPLES
-buffer   = bufftype()
-stat = ps.ps5000aSetDataBuffer(
-    handle, ps.PS5000A_CHANNEL["PS5000A_CHANNEL_A"],
-    ctypes.cast(buffer, ctypes.POINTER(ctypes.c_int16)),
-    N_SAMPLES, 0, 0, ps.PS5000A_RATIO_MODE["PS5000A_RATIO_MODE_NONE"]
-)
-assert stat == 0, f"SetDataBuffer failed (status {stat})."
+# Allocate one numpy buffer per segment once; the driver writes into them
+# directly and they are reused for every capture
+buffers = [np.empty(N_SAMPLES, dtype=np.int16) for _ in range(2)]
+for segment, buffer_np in enumerate(buffers):
+    stat = ps.ps5000aSetDataBuffer(
+        handle, ps.PS5000A_CHANNEL["PS5000A_CHANNEL_A"],
+        buffer_np.ctypes.data_as(ctypes.POINTER(ctypes.c_int16)),
+        N_SAMPLES, segment, ps.PS5000A_RATIO_MODE["PS5000A_RATIO_MODE_NONE"]
+    )
+    assert stat == 0, f"SetDataBuffer failed (status {stat})."
 
 # ------------------- run block -------------------
-segment = 0
-stat = ps.ps5000aRunBlock(
-    handle, 0,               # pre-trigger samples
-    N_SAMPLES,               # post-trigger samples
-    timebase, oversample, None, segment, None, None
-)
-assert stat == 0, f"RunBlock failed (status {stat})."
+# The driver signals completion through lpReady, so the main thread can
+# sleep on an event instead of spinning on IsReady
+block_ready = threading.Event()
 
-# Wait until capture is complete
-ready = ctypes.c_int16(0)
-while not ready.value:
-    ps.ps5000aIsReady(handle, ctypes.byref(ready))
+@ps.BlockReadyType
+def _block_ready_cb(handle, status, param):
+    block_ready.set()
 
-# Stop (not strictly necessary for single block)
-ps.ps5000aStop(handle)
+def run_block(segment):
+    block_ready.clear()
+    stat = ps.ps5000aRunBlock(
+        handle, 0,               # pre-trigger samples
+        N_SAMPLES,               # post-trigger samples
+        timebase, None, segment, _block_ready_cb, None
+    )
+    assert stat == 0, f"RunBlock failed (status {stat})."
 
-# ------------------ fetch data -------------------
-sample_count = ctypes.c_int32(N_SAMPLES)
-stat = ps.ps5000aGetValues(
-    handle, 0, ctypes.byref(sample_count), 1,          # 1 = downsampling ratio
-    ps.PS5000A_RATIO_MODE["PS5000A_RATIO_MODE_NONE"],
-    0, None
-)
-assert stat == 0, f"GetValues failed (status {stat})."
+def wait_ready(timeout=1.0):
+    if not block_ready.wait(timeout):
+        raise TimeoutError("Block capture timed out.")
 
-# ---------------- convert & plot -----------------
 # LSB (ADC count) size for 2 V range on 5444D = 2 V / 32768 ≈ 61 µV
 ADC2V  = 2.0 / 32768
-voltages = np.array(buffer[:N_SAMPLES]) * ADC2V
-times = np.arange(N_SAMPLES) * time_int.value * 1e-9  # ns → s
+sample_count = ctypes.c_int32()
+
+run_block(0)
+for i in range(N_CAPTURES):
+    segment = i & 1
+    # Wait until capture is complete
+    wait_ready()
+
+    # ------------------ fetch data -------------------
+    sample_count.value = N_SAMPLES
+    stat = ps.ps5000aGetValues(
+        handle, 0, ctypes.byref(sample_count), 1,      # 1 = downsampling ratio
+        ps.PS5000A_RATIO_MODE["PS5000A_RATIO_MODE_NONE"],
+        segment, None
+    )
+    assert stat == 0, f"GetValues failed (status {stat})."
+
+    # Arm the other segment before converting this one
+    if i + 1 < N_CAPTURES:
+        run_block(segment ^ 1)
+
+    # -------------------- convert --------------------
+    voltages = buffers[segment][:sample_count.value] * ADC2V
+
+# Stop (not strictly necessary once the last block is in)
+ps.ps5000aStop(handle)
+
+# --------------------- plot ----------------------
+times = np.arange(len(voltages)) * time_int.value * 1e-9  # ns → s
 
 plt.figure()
 plt.plot(times * 1e3, voltages)         # time axis in ms
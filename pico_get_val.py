@@ -2,12 +2,36 @@
 import ctypes
 import time
 import threading
-from collections import deque
-import bisect
 
 import numpy as np
 from picosdk.ps5000a import ps5000a as ps
-from picosdk.functions import adc2mV, assert_pico_ok
+from picosdk.functions import assert_pico_ok
+
+from pico_ranges import RANGE_MV
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _scale_loop(src, scale, dst):
+    """dst[i] = src[i] * scale, int16 → float32 in one fused pass."""
+    for i in range(src.shape[0]):
+        dst[i] = src[i] * scale
+
+
+def _scale_np(src, scale, dst):
+    np.multiply(src, scale, out=dst)
+
+
+# Compile the ADC→mV loop once at import when numba is available; numpy's
+# multiply goes through a float64 temporary for the int16 → float32 cast
+if njit is not None:
+    _scale_into = njit(cache=True, fastmath=True)(_scale_loop)
+    _scale_into(np.zeros(1, np.int16), 1.0, np.empty(1, np.float32))
+else:
+    _scale_into = _scale_np
 
 class PicoStreamer:
     def __init__(self,
@@ -48,6 +72,10 @@ class PicoStreamer:
         self.interval = ctypes.c_int32(interval_us)
         self.units    = ps.PS5000A_TIME_UNITS["PS5000A_US"]
         self.CHUNK    = chunk_size
+        # The driver hands over at most CHUNK samples per call, so polling
+        # twice per chunk keeps up without waking (and retaking the GIL)
+        # once per sample
+        self.poll_period = max(0.0005, self.CHUNK * self.sample_interval_s * 0.5)
         # Set data buffer
         self.bufferA = (ctypes.c_int16 * self.CHUNK)()
         self.status["setBuf"] = ps.ps5000aSetDataBuffers(
@@ -74,34 +102,69 @@ class PicoStreamer:
         )
         assert_pico_ok(self.status["run"])
         print(f"Streaming @ {sample_rate_hz//1000} kHz…")
-        # Rolling time‐stamped buffer
-        self.buffer = deque()  # of (t, value_mV)
-        self.lock   = threading.Lock()
+        # Rolling time‐stamped buffer: paired timestamp/value arrays (SoA),
+        # live samples in [_lo, _hi), appended a whole chunk at a time.
+        # Single producer (the driver callback) / single consumer: only the
+        # callback touches _ts/_vs/_lo/_hi, and it publishes the live window
+        # to readers with one attribute store of _live, so no lock is needed
         self.max_age = max_age_s
+        cap = 2 * (int(max_age_s * sample_rate_hz) + self.CHUNK)
+        self._ts = np.empty(cap)
+        self._vs = np.empty(cap, dtype=np.float32)
+        self._lo = self._hi = 0
+        self._live = (self._ts[:0], self._vs[:0])
+        self._raw = np.ctypeslib.as_array(self.bufferA)
+        self._ages = np.arange(self.CHUNK - 1, -1, -1) * self.sample_interval_s
+        self.mv_per_adc = RANGE_MV[vrange] / self.maxADC.value
         # Prepare callback
         def _cb(handle, noOfSamples, startIndex, overflow, triggerAt, triggered, autoStop, param):
-            # convert raw → mV
-            raw = self.bufferA[startIndex : startIndex + noOfSamples]
-            mv  = adc2mV(raw, vrange, self.maxADC)
             now = time.perf_counter()
-            with self.lock:
-                # stamp each sample, spacing them by sample_interval_s
-                for i, v in enumerate(mv):
-                    t = now - (noOfSamples - 1 - i) * self.sample_interval_s
-                    self.buffer.append((t, v))
-                # prune old
-                cutoff = now - self.max_age
-                while self.buffer and self.buffer[0][0] < cutoff:
-                    self.buffer.popleft()
+            self._append(now, startIndex, noOfSamples)
+            # prune old
+            self._lo += int(np.searchsorted(self._ts[self._lo:self._hi],
+                                            now - self.max_age))
+            # publish last, after the samples are written
+            self._live = (self._ts[self._lo:self._hi], self._vs[self._lo:self._hi])
         self.cb_type = ps.StreamingReadyType(_cb)
         # Thread control
         self.stop_event = threading.Event()
         self.thread = threading.Thread(target=self._poller, daemon=True)
 
+    def _append(self, now, start, n):
+        """Append n driver samples from bufferA[start:]; callback thread only."""
+        if self._hi + n > len(self._ts):
+            # move the live window to the front of fresh arrays (growing if
+            # needed) rather than shifting in place, so the published window
+            # stays valid while readers hold it
+            live = self._hi - self._lo
+            cap = max(len(self._ts), 2 * (live + n))
+            new_ts = np.empty(cap)
+            new_vs = np.empty(cap, dtype=np.float32)
+            new_ts[:live] = self._ts[self._lo:self._hi]
+            new_vs[:live] = self._vs[self._lo:self._hi]
+            self._ts, self._vs = new_ts, new_vs
+            self._lo, self._hi = 0, live
+        hi = self._hi
+        # stamp each sample, spacing them by sample_interval_s, and convert
+        # raw → mV straight into the ring
+        np.subtract(now, self._ages[self.CHUNK - n:], out=self._ts[hi:hi + n])
+        _scale_into(self._raw[start:start + n], self.mv_per_adc,
+                    self._vs[hi:hi + n])
+        self._hi = hi + n
+
     def _poller(self):
-        while not self.stop_event.is_set():
-            ps.ps5000aGetStreamingLatestValues(self.chandle, self.cb_type, None)
-            time.sleep(self.sample_interval_s)  # poll at sample_interval
+        # Windows rounds sleeps up to the ~15.6 ms system tick, far longer
+        # than a chunk; ask for 1 ms timer resolution while streaming
+        winmm = getattr(ctypes, "windll", None) and ctypes.windll.winmm
+        if winmm:
+            winmm.timeBeginPeriod(1)
+        try:
+            while not self.stop_event.is_set():
+                ps.ps5000aGetStreamingLatestValues(self.chandle, self.cb_type, None)
+                time.sleep(self.poll_period)
+        finally:
+            if winmm:
+                winmm.timeEndPeriod(1)
 
     def start(self):
         """Begin background streaming / buffering."""
@@ -109,19 +172,19 @@ class PicoStreamer:
 
     def get_value_at(self, t_query):
         """Return the mV value closest to t_query (perf_counter reference)."""
-        with self.lock:
-            if not self.buffer:
-                raise RuntimeError("No data available yet")
-            times = [t for t, _ in self.buffer]
-        i = bisect.bisect_left(times, t_query)
+        # The callback writes past the published window or into fresh
+        # arrays, never into a window a reader may hold
+        ts, vs = self._live
+        if not len(ts):
+            raise RuntimeError("No data available yet")
+        i = int(np.searchsorted(ts, t_query))
         # clamp & pick nearest
         if i <= 0:
-            return self.buffer[0][1]
-        if i >= len(self.buffer):
-            return self.buffer[-1][1]
-        t0, v0 = self.buffer[i-1]
-        t1, v1 = self.buffer[i]
-        return v0 if abs(t_query - t0) <= abs(t1 - t_query) else v1
+            return float(vs[0])
+        if i >= len(ts):
+            return float(vs[-1])
+        t0, t1 = ts[i-1], ts[i]
+        return float(vs[i-1] if abs(t_query - t0) <= abs(t1 - t_query) else vs[i])
 
     def stop(self):
         """Halt streaming and clean up."""
@@ -0,0 +1,5 @@
+"""PicoScope 5000A constants shared by the pico scripts (no SDK import)."""
+
+# Full-scale mV of each PS5000A_RANGE index (same table adc2mV uses)
+RANGE_MV = [10, 20, 50, 100, 200, 500, 1000, 2000, 5000,
+            10000, 20000, 50000, 100000, 200000]
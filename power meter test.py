@@ -21,6 +21,9 @@ INTERVAL = 0.1
 
 # Number of points to keep on screen
 BUFFER_SIZE = 200
+
+# Full redraw (axis rescale) every N readings; frames in between are blitted
+RESCALE_EVERY = 10
 # —————————————
 
 def main():
@@ -39,14 +42,20 @@ def main():
     # Data buffers
     times = np.zeros(BUFFER_SIZE)
     powers = np.zeros(BUFFER_SIZE)
+    # Oldest-first copies of the ring for plotting once it has wrapped
+    disp_times = np.empty(BUFFER_SIZE)
+    disp_powers = np.empty(BUFFER_SIZE)
 
     # Plot objects
-    line, = ax.plot(times, powers, '-o', markersize=4)
+    line, = ax.plot(times, powers, '-o', markersize=4, animated=True)
     text = ax.text(0.02, 0.95, "", transform=ax.transAxes, fontsize=14,
-                   bbox=dict(facecolor='white', alpha=0.8))
+                   bbox=dict(facecolor='white', alpha=0.8), animated=True)
+    background = None
 
     start = time.time()
     idx = 0
+    head = 0     # next slot to write; the oldest sample once the ring is full
+    full = False
 
     try:
         while True:
@@ -57,29 +66,43 @@ def main():
             t = time.time() - start
 
             # Update circular buffer
-            times[idx % BUFFER_SIZE] = t
-            powers[idx % BUFFER_SIZE] = p_mw
+            times[head] = t
+            powers[head] = p_mw
             idx += 1
+            head += 1
+            if head == BUFFER_SIZE:
+                head = 0
+                full = True
 
             # Update line data
-            if idx < BUFFER_SIZE:
-                line.set_data(times[:idx], powers[:idx])
-                ax.set_xlim(0, times[idx-1] + 0.1)
+            if not full:
+                line.set_data(times[:head], powers[:head])
             else:
-                # roll display window
-                window = times[(idx - BUFFER_SIZE) % BUFFER_SIZE]
-                line.set_data(times, powers)
-                ax.set_xlim(window, window + times.max() - times.min())
-
-            # Autoscale Y
-            ax.relim()
-            ax.autoscale_view(True, True, True)
+                np.concatenate((times[head:], times[:head]), out=disp_times)
+                np.concatenate((powers[head:], powers[:head]), out=disp_powers)
+                line.set_data(disp_times, disp_powers)
 
             # Update text
             text.set_text(f"{p_mw:6.2f} mW")
 
-            # Redraw
-            fig.canvas.draw()
+            # Rescaling invalidates the cached background, so only do a full
+            # redraw every RESCALE_EVERY readings. The x-window is padded to
+            # cover the readings blitted until the next rescale.
+            if background is None or idx % RESCALE_EVERY == 0:
+                # roll display window
+                window = times[head] if full else 0
+                ax.set_xlim(window, t + RESCALE_EVERY * INTERVAL)
+                # Autoscale Y
+                ax.relim()
+                ax.autoscale_view(True, True, True)
+                fig.canvas.draw()
+                background = fig.canvas.copy_from_bbox(ax.bbox)
+
+            # Redraw only the animated artists
+            fig.canvas.restore_region(background)
+            ax.draw_artist(line)
+            ax.draw_artist(text)
+            fig.canvas.blit(ax.bbox)
             fig.canvas.flush_events()
 
             time.sleep(INTERVAL)
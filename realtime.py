@@ -0,0 +1,28 @@
+"""Opt-in real-time scheduling shared by the galvo and motor scripts."""
+import os
+
+# set HRRWLPP_REALTIME=1 to pin to the last CPU and use real-time scheduling
+REALTIME_ENV = 'HRRWLPP_REALTIME'
+
+
+def raise_priority():
+    """
+    Opt-in: when HRRWLPP_REALTIME=1, pin this process to the last CPU and raise
+    its scheduling priority (SCHED_FIFO 50 on Linux, HIGH_PRIORITY_CLASS on
+    Windows) so USB/serial writes see less OS jitter.  Needs CAP_SYS_NICE
+    (Linux) or an elevated shell (Windows); silently skipped otherwise.
+    """
+    if os.environ.get(REALTIME_ENV) != '1':
+        return
+    cpu = (os.cpu_count() or 1) - 1
+    try:
+        if hasattr(os, 'sched_setaffinity'):            # Linux
+            os.sched_setaffinity(0, {cpu})
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(50))
+        else:                                           # Windows
+            import psutil
+            proc = psutil.Process()
+            proc.cpu_affinity([cpu])
+            proc.nice(psutil.HIGH_PRIORITY_CLASS)
+    except (ImportError, OSError, AttributeError):
+        pass
@@ -63,14 +63,14 @@ class WebcamTab(QWidget):
         ret, frame = self.cap.read()
         if not ret:
             return
-        # Adjust brightness based on slider
+        # Adjust brightness based on slider; skip the pass entirely at 0
         brightness = self.brightness_slider.value()
-        frame = cv2.convertScaleAbs(frame, alpha=1, beta=brightness)
-        # Convert color for Qt
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        if brightness:
+            cv2.convertScaleAbs(frame, dst=frame, alpha=1, beta=brightness)
+        # Qt reads OpenCV's BGR byte order directly
         h, w, ch = frame.shape
         bytes_per_line = ch * w
-        qimg = QImage(frame.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
+        qimg = QImage(frame.data, w, h, bytes_per_line, QImage.Format.Format_BGR888)
         self.video_label.setPixmap(QPixmap.fromImage(qimg))
 
     def closeEvent(self, event):
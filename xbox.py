@@ -1,53 +1,235 @@
 import pygame
-import time
+import sys
+import threading
+import numpy as np
 
-# Initialize Pygame and joystick module
+# Initialize Pygame and joystick module. Input stays on pygame/SDL rather
+# than raw hidapi/evdev: on Windows the Xbox pad is an XInput device with no
+# readable HID input report, and SDL already decodes each pad model's report
+# layout and handles hotplug.
 pygame.init()
 pygame.joystick.init()
 
-def get_controller_state(joystick):
-    pygame.event.pump()  # Process event queue
+# Poll interval backs off from POLL_MIN to POLL_MAX (s) while nothing changes
+POLL_MIN = 0.002
+POLL_MAX = 0.050
+# While the pad is active, peek for an event this many times before blocking
+POLL_ROUNDS = 32
+# Axis changes smaller than this are not reported
+AXIS_EPS = 1e-3
+# Stick readings inside this band are reported as exactly 0
+DEADZONE = 0.08
+# Buttons and hats are only re-read after one of these events
+BUTTON_HAT_EVENTS = [pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP, pygame.JOYHATMOTION]
+JOY_EVENTS = [pygame.JOYAXISMOTION] + BUTTON_HAT_EVENTS
 
-    state = {
-        'axes': [joystick.get_axis(i) for i in range(joystick.get_numaxes())],
-        'buttons': [joystick.get_button(i) for i in range(joystick.get_numbuttons())],
-        'hats': [joystick.get_hat(i) for i in range(joystick.get_numhats())]
+def init_state(joystick):
+    # Query the controller's capabilities once; the arrays are reused
+    # (overwritten in place) by every get_controller_state call and can be
+    # thresholded/scaled as a whole by consumers
+    return {
+        'axes': np.zeros(joystick.get_numaxes(), dtype=np.float32),
+        'buttons': np.zeros(joystick.get_numbuttons(), dtype=np.uint8),
+        'hats': np.zeros((joystick.get_numhats(), 2), dtype=np.int8)
     }
+
+# The poll functions take optional index ranges so a polling loop can build
+# them once instead of allocating new range objects every tick
+
+def poll_axes(joystick, axes, axis_idx=None):
+    # Zero jitter around the rest position here so it never looks like input
+    get_axis = joystick.get_axis
+    for i in axis_idx or range(len(axes)):
+        v = get_axis(i)
+        axes[i] = 0.0 if -DEADZONE < v < DEADZONE else v
+
+def poll_buttons_hats(joystick, buttons, hats, button_idx=None, hat_idx=None):
+    # map() runs the per-button calls from C and fills the array in one go
+    buttons[:] = tuple(map(joystick.get_button, button_idx or range(len(buttons))))
+    get_hat = joystick.get_hat
+    for i in hat_idx or range(len(hats)):
+        hats[i] = get_hat(i)
+
+# Reused by get_controller_state calls that don't pass their own state
+_STATE = {}
+
+def get_controller_state(joystick, state=None):
+    """Poll every input into state and return it.
+
+    Without a state the module-level _STATE is filled (sized on first use)
+    and returned; treat it as borrowed, since the next such call overwrites it.
+    """
+    pygame.event.pump()  # Process event queue
+
+    if state is None:
+        if not _STATE:
+            _STATE.update(init_state(joystick))
+        state = _STATE
+    poll_axes(joystick, state['axes'])
+    poll_buttons_hats(joystick, state['buttons'], state['hats'])
     return state
 
-def coordinates(joystick):
-    state = get_controller_state(joystick)
-    axes = state['axes']
-    if len(axes) >= 2:
-        return (axes[0], axes[1])  # Typically left stick X, Y
-    return (0.0, 0.0)
+def make_coordinates(n_axes):
+    """Return coordinates(state) specialised for a pad with n_axes axes.
+
+    The returned function takes an already-polled state so callers don't
+    poll the pad twice.
+    """
+    if n_axes >= 2:
+        def coordinates(state):
+            axes = state['axes']
+            return (float(axes[0]), float(axes[1]))  # Typically left stick X, Y
+    else:
+        def coordinates(state):
+            return (0.0, 0.0)
+    return coordinates
+
+def wait_for_input(timeout_ms, rounds=POLL_ROUNDS):
+    """Spin briefly for a controller event, then block for up to timeout_ms.
+
+    Returns the event taken by the blocking wait, or None if the spin saw
+    one (it is left queued).
+    """
+    for _ in range(rounds):
+        if pygame.event.peek(JOY_EVENTS):
+            return None
+    return pygame.event.wait(timeout_ms)
+
+def diff_state(state, prev):
+    """Return report lines for entries of state that differ from prev, then
+    update prev. An empty list means nothing changed.
+    """
+    lines = []
+    axes, prev_axes = state['axes'], prev['axes']
+    moved = np.flatnonzero(np.abs(axes - prev_axes) > AXIS_EPS)
+    for i in moved:
+        lines.append(f"Axis {i}: {axes[i]:+.3f}")
+    prev_axes[moved] = axes[moved]
+
+    buttons, prev_buttons = state['buttons'], prev['buttons']
+    toggled = np.flatnonzero(buttons != prev_buttons)
+    for i in toggled:
+        lines.append(f"Button {i}: {'down' if buttons[i] else 'up'}")
+    prev_buttons[toggled] = buttons[toggled]
+
+    hats, prev_hats = state['hats'], prev['hats']
+    pressed = np.flatnonzero((hats != prev_hats).any(axis=1))
+    for i in pressed:
+        lines.append(f"D-pad {i}: ({hats[i, 0]}, {hats[i, 1]})")
+    prev_hats[pressed] = hats[pressed]
+
+    return lines
+
+class ControllerPoller(threading.Thread):
+    """Polls the controller on a worker thread into a latest-value slot.
+
+    The poll loop backs off while the pad is idle and publishes a copy of
+    the state only when it changes, so callers never block on controller
+    I/O and read the newest snapshot with snapshot().
+    """
+
+    def __init__(self, joystick):
+        super().__init__(daemon=True)
+        self.joystick = joystick
+        # own buffers, written by the poll thread only
+        self.state = get_controller_state(joystick, init_state(joystick))
+        self.lock = threading.Lock()
+        self.latest = {k: v.copy() for k, v in self.state.items()}
+        self.updated = threading.Event()
+        self.running = True
+
+    def run(self):
+        js = self.joystick
+        axes, buttons, hats = self.state['axes'], self.state['buttons'], self.state['hats']
+        latest = self.latest
+        axis_idx, button_idx, hat_idx = range(len(axes)), range(len(buttons)), range(len(hats))
+        interval = POLL_MIN
+        while self.running:
+            # Any controller event ends the wait early; otherwise poll at the
+            # current interval, which grows while the pad sits idle. Spin
+            # first only while active, so idle ticks go straight to sleep
+            ev = wait_for_input(int(interval * 1000),
+                                POLL_ROUNDS if interval == POLL_MIN else 0)
+            # Queued events only wake the loop: axes are read every tick,
+            # buttons/hats only if one of their events came in
+            buttons_due = ((ev is not None and ev.type in BUTTON_HAT_EVENTS)
+                           or pygame.event.get(BUTTON_HAT_EVENTS))
+            pygame.event.clear(pump=False)
+            poll_axes(js, axes, axis_idx)
+            if buttons_due:
+                poll_buttons_hats(js, buttons, hats, button_idx, hat_idx)
+            # latest is only written by this thread, so it's read unlocked
+            changed = ((np.abs(axes - latest['axes']) > AXIS_EPS).any()
+                       or not np.array_equal(buttons, latest['buttons'])
+                       or not np.array_equal(hats, latest['hats']))
+            if not changed:
+                interval = min(interval * 2, POLL_MAX)
+                continue
+            interval = POLL_MIN
+            with self.lock:
+                for k, v in self.state.items():
+                    np.copyto(latest[k], v)
+            self.updated.set()
+
+    def snapshot(self, out=None):
+        """Copy the latest state into out (allocated if None) and return it."""
+        with self.lock:
+            if out is None:
+                return {k: v.copy() for k, v in self.latest.items()}
+            for k, v in self.latest.items():
+                np.copyto(out[k], v)
+        return out
+
+    def stop(self):
+        self.running = False
+        self.join()
 
 def main():
-    # Wait for at least one joystick
-    while pygame.joystick.get_count() == 0:
+    # Wait for at least one joystick. SDL posts JOYDEVICEADDED on hotplug,
+    # which ends the wait; the timeout only keeps Ctrl-C responsive
+    if pygame.joystick.get_count() == 0:
         print("Waiting for controller...")
-        pygame.joystick.quit()
-        pygame.joystick.init()
-        time.sleep(1)
+        while pygame.joystick.get_count() == 0:
+            pygame.event.wait(1000)
 
     # Initialize the first controller
     joystick = pygame.joystick.Joystick(0)
     joystick.init()
     print(f"Detected controller: {joystick.get_name()}")
+    # Keep everything but controller input out of the event queue, so SDL
+    # doesn't build (and we don't wake for) events nobody reads
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(JOY_EVENTS)
+    poller = ControllerPoller(joystick)
+    state = poller.snapshot()
+    axes, buttons, hats = state['axes'], state['buttons'], state['hats']
+    prev = {'axes': axes.copy(), 'buttons': buttons.copy(), 'hats': hats.copy()}
+    coordinates = make_coordinates(len(axes))
+    poller.start()
+    sep = '-' * 40
+    sys.stdout.write(f"Axes: {axes}\nButtons: {buttons}\nD-pad: {hats}\n{sep}\n")
 
     try:
         while True:
-            state = get_controller_state(joystick)
-            print("Axes:", state['axes'])
-            print("Buttons:", state['buttons'])
-            print("D-pad:", state['hats'])
-            print("Left Stick Coordinates:", coordinates(joystick))
-            print('-' * 40)
-            time.sleep(1)  # polling interval (1 second)
+            # The timeout only keeps Ctrl-C responsive
+            if not poller.updated.wait(1.0):
+                continue
+            poller.updated.clear()
+            poller.snapshot(state)
+            lines = diff_state(state, prev)
+            if not lines:
+                continue
+            x, y = coordinates(state)
+            lines.append(f"Left Stick Coordinates: ({x:+.3f}, {y:+.3f})")
+            lines.append(sep)
+            # one write per report instead of one print per line
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
 
     except KeyboardInterrupt:
         print("Exiting...")
     finally:
+        poller.stop()
         pygame.quit()
 
 if __name__ == '__main__':
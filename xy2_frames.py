@@ -0,0 +1,58 @@
+"""
+XY2-100 frame builders shared by the FT232H galvo scripts.
+
+Pins: D0 = Y data, D1 = X data, D2 = frame sync, D3 = clock.  A frame is
+40 sync bit-bang samples (two per clock): preamble with control bits
+0,0,1, the 16-bit X and Y codes MSB first on their lanes, and a postamble.
+"""
+from functools import lru_cache
+
+# ------------- BYTE SPREAD TABLES -------------
+# One table per byte of a 16-bit code: entry b is that byte's contribution
+# to the 40-byte frame (as a big-endian int), each set bit landing on its
+# axis' lane in both half-cycles of its clock.
+def _spread_table(lane_bit, first_bit):
+    table = []
+    for b in range(256):
+        w = 0
+        for k in range(8):
+            if (b >> (7 - k)) & 1:
+                pos = 6 + 2 * (first_bit + k)
+                w |= (lane_bit << (8 * (39 - pos))) | (lane_bit << (8 * (38 - pos)))
+        table.append(w)
+    return table
+
+_X_HI, _X_LO = _spread_table(1 << 1, 0), _spread_table(1 << 1, 8)
+_Y_HI, _Y_LO = _spread_table(1 << 0, 0), _spread_table(1 << 0, 8)
+# preamble (FS + control bits 0,0,1), CLK on every data clock, postamble
+_FRAME_BASE = int.from_bytes(bytes([0x0C, 0x04, 0x08, 0x00, 0x0B, 0x03]
+                                   + [0x08, 0x00] * 17), 'big')
+
+
+def frame_bytes(x, y):
+    """40-byte frame for the 16-bit codes x, y (0…65535); no numpy needed."""
+    w = (_FRAME_BASE | _X_HI[x >> 8] | _X_LO[x & 0xFF]
+         | _Y_HI[y >> 8] | _Y_LO[y & 0xFF])
+    return w.to_bytes(40, 'big')
+
+
+# ------------- FULL FRAME TABLES (numpy) -------------
+def _lane_seq(lane_bit):
+    """(65536, 40) uint8: the 16 data clocks of a frame on one axis' lane."""
+    import numpy as np
+    v = np.arange(65536, dtype=np.uint32)
+    bits = ((v[:, None] >> np.arange(15, -1, -1)) & 1).astype(np.uint8)
+    seq = np.zeros((65536, 40), dtype=np.uint8)
+    seq[:, 6:38] = np.repeat(bits * lane_bit, 2, axis=1)
+    return seq
+
+
+@lru_cache(maxsize=1)
+def lane_tables():
+    """
+    (X_SEQ, Y_SEQ), each (65536, 40) uint8 (~5 MB together), built once per
+    process: X_SEQ[x] | Y_SEQ[y] is the full frame for codes x, y.
+    """
+    import numpy as np
+    base = np.frombuffer(_FRAME_BASE.to_bytes(40, 'big'), dtype=np.uint8)
+    return _lane_seq(1 << 1) | base, _lane_seq(1 << 0)